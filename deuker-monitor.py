@@ -9,7 +9,10 @@ Python Version: 3.11.9
 
 import os
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import shutil
 import time
 import json
 import re
@@ -18,13 +21,67 @@ from pathlib import Path
 from typing import List, Set, Dict, Optional
 import hashlib
 import logging
+import threading
 import argparse
-from dataclasses import dataclass, asdict
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+import atexit
+import random
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, fields
 from urllib.parse import urljoin
-from playwright.sync_api import sync_playwright, Browser, Page, Playwright
-
-
-@dataclass
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Playwright
+
+try:
+    # Binary state files are a fraction of the size of indented JSON and
+    # much faster to (de)serialize; fall back to JSON when unavailable
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# Case numbers look like F-25-024652; compiled once instead of per row
+_CASE_NUM_RE = re.compile(r'(F-\d{2}-\d+)')
+_CASE_CLEAN_RE = re.compile(r'[-\s]')
+_PUNCT_STRIP_RE = re.compile(r'[^\w\s]')
+_SAFE_DESC_STRIP_RE = re.compile(r'[^\w\s-]')
+_SAFE_DESC_DASH_RE = re.compile(r'[-\s]+')
+_PDF_URL_RE = re.compile(r'(https?://[^\s<>"]+\.pdf[^\s<>"]*|/cjis/[^\s<>"]*docketimage[^\s<>"]*)')
+_VIEW_DOC_URL_RE = re.compile(r'(https?://[^\s<>"]+\.pdf[^\s<>"]*|/cjis/[^\s<>"]*viewDocument[^\s<>"]*)')
+
+# Carrier email-to-SMS gateways strip HTML; when every recipient is one
+# of these, building the HTML alternative is pure waste
+_SMS_GATEWAY_DOMAINS = frozenset({
+    'txt.att.net', 'vtext.com', 'tmomail.net',
+    'messaging.sprintpcs.com', 'pm.sprint.com', 'vzwpix.com',
+})
+
+# Single translate pass beats chained replace() for one-char substitutions
+_SANITIZE_TBL = str.maketrans(' ', '_')
+
+
+def _default_data_file(first_name: str, last_name: str) -> str:
+    """Derive the per-defendant data file name from the defendant's name"""
+    safe_first = first_name.lower().translate(_SANITIZE_TBL)
+    safe_last = last_name.lower().translate(_SANITIZE_TBL)
+    return f"docket_monitor_{safe_last}_{safe_first}.json"
+
+# All court-page scraping only ever reads <table> content, so skip parsing
+# the rest of the DOM (nav, scripts, styling) entirely
+_TABLES_ONLY = SoupStrainer('table')
+
+# Parse with libxml2 when available - typically 5-10x faster than the
+# pure-Python html.parser backend on large case pages
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = 'lxml'
+except ImportError:
+    _SOUP_PARSER = 'html.parser'
+
+
+@dataclass(slots=True)
 class Charge:
     """Represents a single charge"""
     case_number: str
@@ -32,10 +89,10 @@ class Charge:
     charge_description: str
     charge_type: str
     disposition: str
-    timestamp_found: str
+    timestamp_found: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DocketEntry:
     """Represents a single docket entry"""
     case_number: str
@@ -43,13 +100,14 @@ class DocketEntry:
     date: str
     docket_description: str
     book_page: str
-    timestamp_found: str
+    timestamp_found: int
     has_document: bool = False
     document_downloaded: bool = False
     document_filename: str = ""
+    document_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CaseInfo:
     """Represents a case with its docket entries and charges"""
     case_number: str
@@ -59,7 +117,9 @@ class CaseInfo:
     balance_due: str
     charge_count: int
     docket_count: int
-    last_checked: str
+    last_checked: int
+    last_etag: str = ""
+    last_modified: str = ""
 
 
 @dataclass
@@ -74,12 +134,66 @@ class IceDetaineeStatus:
     first_seen: str
 
 
+def _record_dict(obj) -> dict:
+    """Shallow dict of a flat record dataclass
+
+    All record types here hold only scalars, so asdict()'s recursive
+    deep-copy pass is pure overhead on the serialization paths.
+    """
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
 class MiamiDadeCourtMonitor:
     """Monitor Miami-Dade court cases for docket updates"""
     
     BASE_URL = "https://www2.miamidadeclerk.gov"
     SEARCH_URL = "https://www2.miamidadeclerk.gov/cjis/"
 
+    # Polls between full state snapshots; the append-only journal covers
+    # newly-seen hashes in between, so per-poll I/O stays O(new entries)
+    SNAPSHOT_EVERY = 20
+
+    # Consecutive HEAD-validated skips allowed before forcing a full
+    # re-scrape anyway, in case the server serves a constant validator
+    HEAD_SKIP_MAX = 12
+
+    # Minimum spacing between case-page navigations, shared across all
+    # workers - a global politeness floor (~5 loads/sec) instead of a
+    # flat 1s sleep between sequential cases
+    CASE_NAV_MIN_INTERVAL = 0.2
+
+    # Messages sent over one SMTP session before forcing a reconnect -
+    # providers cap per-connection sends well before this
+    SMTP_MAX_MSGS_PER_CONN = 500
+
+    # Static HTML skeleton shared by the court and ICE alert emails; the
+    # send paths only format in the banner color, title, and footer line
+    EMAIL_HTML_HEADER = """
+                    <html>
+                      <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                        <div style="background-color: {banner_color}; color: white; padding: 15px; border-radius: 5px 5px 0 0;">
+                          <h2 style="margin: 0;">{title}</h2>
+                          <p style="margin: 5px 0 0 0; font-size: 16px;">{defendant}</p>
+                        </div>
+                        <div style="padding: 20px; background-color: #f5f5f5; border-radius: 0 0 5px 5px;">
+                    """
+    EMAIL_HTML_FOOTER = """
+                        </div>
+                        <div style="text-align: center; padding: 15px; color: #999; font-size: 12px;">
+                          <p>{footer}</p>
+                        </div>
+                      </body>
+                    </html>
+                    """
+    EMAIL_CHARGE_ITEM = '<li><strong>{desc}</strong> ({type})</li>'
+    EMAIL_DOCKET_ROW = """
+                                  <tr style="border-bottom: 1px solid #eee;">
+                                    <td style="padding: 8px;">{din}</td>
+                                    <td style="padding: 8px;">{date}</td>
+                                    <td style="padding: 8px;">{desc}</td>
+                                  </tr>
+                                """
+
     def __init__(self,
                  defendant_first_name: str,
                  defendant_last_name: str,
@@ -94,6 +208,8 @@ class MiamiDadeCourtMonitor:
                  documents_dir: str = "court_documents",
                  filter_case_number: str = "",
                  enable_screenshots: bool = False,
+                 parallel_cases: int = 1,
+                 download_concurrency: int = 4,
                  smtp_server: str = "",
                  smtp_port: int = 587,
                  smtp_username: str = "",
@@ -124,6 +240,8 @@ class MiamiDadeCourtMonitor:
             documents_dir: Directory to store downloaded documents (default: court_documents)
             filter_case_number: Monitor only this specific case number (e.g., F-25-024652 or F25024652)
             enable_screenshots: Enable debug screenshots (default: False)
+            parallel_cases: Number of cases to scrape concurrently (default: 1 = sequential)
+            download_concurrency: Max simultaneous direct document downloads (default: 4)
             smtp_server: SMTP server for email (e.g., smtp.gmail.com)
             smtp_port: SMTP port (default: 587)
             smtp_username: SMTP username
@@ -135,20 +253,37 @@ class MiamiDadeCourtMonitor:
         """
         self.defendant_first_name = defendant_first_name
         self.defendant_last_name = defendant_last_name
+        # Formatted once here; log lines and notification subjects reuse
+        # it instead of re-concatenating first+last every time
+        self.display_name = f"{defendant_first_name} {defendant_last_name}"
         self.defendant_sex = defendant_sex
         self.poll_interval = poll_interval
         self.data_file = Path(data_file)
-        self.seen_charges: Set[str] = set()
-        self.seen_dockets: Set[str] = set()
+        # Plain sets of 64-bit int hashes. Deliberately no probabilistic
+        # (Bloom) layer in front: the exact set must be kept anyway to
+        # confirm hits, so a filter would add work and a dependency while
+        # saving nothing - even years of polling stays in the low MBs
+        self.seen_charges: Set[int] = set()
+        self.seen_dockets: Set[int] = set()
         self.seen_documents: Set[str] = set()  # Track downloaded documents
+        self.seen_document_hashes: Set[str] = set()  # Content hashes of stored PDFs
         self.case_info: Dict[str, CaseInfo] = {}
         self.headless = headless
         self.skip_state = skip_state
         self.notification_sms = notification_sms
         self.notification_email = notification_email
+        # Comma-separated recipient list parsed once, not per send
+        self._email_recipients = [e.strip() for e in notification_email.split(',')] \
+            if notification_email else []
+        # Skip HTML body construction when no recipient can render it
+        self._email_wants_html = any(
+            r.rsplit('@', 1)[-1].lower() not in _SMS_GATEWAY_DOMAINS
+            for r in self._email_recipients)
         self.download_documents = download_documents
         self.documents_dir = Path(documents_dir)
         self.enable_screenshots = enable_screenshots
+        self.parallel_cases = max(1, parallel_cases)
+        self.download_concurrency = max(1, download_concurrency)
         self.screenshots_dir = Path("screenshots")
         self.screenshot_counter = 0
 
@@ -164,6 +299,21 @@ class MiamiDadeCourtMonitor:
         self.twilio_auth_token = twilio_auth_token
         self.twilio_phone_number = twilio_phone_number
 
+        # Notification clients are cached across polls - each fresh Twilio
+        # client / SMTP session costs a TCP + TLS handshake
+        self._twilio_client = None
+        self._smtp = None
+        self._smtp_msg_count = 0
+        # An email send abandoned by the fan-out timeout may still be
+        # running on its pool thread when the next cycle sends; RLock
+        # because _smtp_send closes/reopens the session while holding it
+        self._smtp_lock = threading.RLock()
+        self._notify_pool = None
+
+        # Rate-limiter state for case navigations; the dict is shared with
+        # parallel worker clones so the politeness floor is global
+        self._nav_state = {'lock': threading.Lock(), 'next': 0.0}
+
         # ICE detainee locator configuration
         self.ice_monitoring = ice_monitoring
         self.country_of_birth = country_of_birth
@@ -173,6 +323,33 @@ class MiamiDadeCourtMonitor:
         self.ice_status: Optional[IceDetaineeStatus] = None
         self.ice_check_failures: int = 0
 
+        # Append-only journal of newly-seen hashes between snapshots
+        self._journal_file = self.data_file.with_suffix('.journal')
+        self._journal = None
+        # Parallel case workers journal through the parent monitor, so
+        # appends need to be serialized across threads
+        self._journal_lock = threading.Lock()
+        self._polls_since_snapshot = 0
+
+        # Consecutive HEAD-validated scrape skips per case number
+        self._head_skip_streak: Dict[str, int] = {}
+
+        # Per-case signature of the last-seen charge/docket table cells
+        # plus the document total observed then; lets an unchanged case
+        # skip the click-heavy document passes (shared with worker clones)
+        self._case_page_sig: Dict[str, tuple] = {}
+
+        # PDF URLs captured by the response listener as the viewer loads
+        # them - spares a full page.content() serialization per download
+        self._recent_pdf_urls: deque = deque(maxlen=8)
+
+        # Consecutive failed document downloads, for backoff pacing
+        self._download_failures = 0
+
+        # Selector that last worked per UI role, tried first next time so
+        # the happy path skips the fallback chain and its timeouts
+        self._learned_selectors: Dict[str, str] = {}
+
         # Create screenshots directory if screenshots are enabled
         if self.enable_screenshots:
             self.screenshots_dir.mkdir(exist_ok=True)
@@ -190,6 +367,15 @@ class MiamiDadeCourtMonitor:
 
         self.filter_case_number = self._normalize_case_number(filter_case_number) if filter_case_number else ""
 
+        # Surface notification misconfiguration at startup rather than at
+        # the first alert
+        if self.notification_sms and not all([self.twilio_account_sid, self.twilio_auth_token,
+                                              self.twilio_phone_number]):
+            self.logger.warning("⚠️  SMS notifications enabled but Twilio credentials are incomplete")
+        if self.notification_email and not all([self.smtp_server, self.smtp_username,
+                                                self.smtp_password]):
+            self.logger.warning("⚠️  Email notifications enabled but SMTP credentials are incomplete")
+
         # Create documents directory if download is enabled
         if self.download_documents:
             self.documents_dir.mkdir(exist_ok=True)
@@ -197,8 +383,21 @@ class MiamiDadeCourtMonitor:
         # Playwright objects - will be initialized in _init_browser()
         self.playwright: Optional[Playwright] = None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
 
+        # Shared HTTP session for direct document downloads - keep-alive
+        # avoids a TLS handshake per PDF against the same court host
+        self.http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+
         # Load previous state
         self._load_state()
 
@@ -216,13 +415,13 @@ class MiamiDadeCourtMonitor:
             return ""
 
         # Remove all existing dashes and spaces
-        clean = case_number.replace('-', '').replace(' ', '').upper()
+        clean = _CASE_CLEAN_RE.sub('', case_number).upper()
 
         # Expected format: F25024652 (letter + 8 digits)
         # Convert to: F-25-024652
         if len(clean) == 9 and clean[0].isalpha() and clean[1:].isdigit():
             normalized = f"{clean[0]}-{clean[1:3]}-{clean[3:]}"
-            self.logger.debug(f"Normalized case number: {case_number} -> {normalized}")
+            self.logger.debug("Normalized case number: %s -> %s", case_number, normalized)
             return normalized
         else:
             # Already has dashes or unknown format, return as-is
@@ -235,70 +434,262 @@ class MiamiDadeCourtMonitor:
             self.logger.info("Skipping state loading (--all mode)")
             return
 
-        if self.data_file.exists():
+        data = None
+
+        # Prefer the binary snapshot; fall back to the legacy JSON file so
+        # existing state migrates on the next save
+        msgpack_file = self.data_file.with_suffix('.msgpack')
+        if msgpack is not None and msgpack_file.exists():
+            try:
+                with open(msgpack_file, 'rb') as f:
+                    data = msgpack.unpackb(f.read(), raw=False)
+            except Exception as e:
+                self.logger.error(f"Error loading msgpack state: {e}")
+
+        if data is None and self.data_file.exists():
             try:
                 with open(self.data_file, 'r') as f:
                     data = json.load(f)
-                    self.seen_charges = set(data.get('seen_charges', []))
-                    self.seen_dockets = set(data.get('seen_dockets', []))
-                    self.seen_documents = set(data.get('seen_documents', []))
-                    # Reconstruct case_info
-                    for case_num, case_data in data.get('case_info', {}).items():
-                        self.case_info[case_num] = CaseInfo(**case_data)
-                    # Reconstruct ICE status
-                    ice_data = data.get('ice_status')
-                    if ice_data:
-                        self.ice_status = IceDetaineeStatus(**ice_data)
-                    self.ice_check_failures = data.get('ice_check_failures', 0)
-                self.logger.info(f"Loaded {len(self.seen_charges)} seen charges, "
-                               f"{len(self.seen_dockets)} seen dockets, "
-                               f"{len(self.seen_documents)} downloaded documents, "
-                               f"{len(self.case_info)} tracked cases")
             except Exception as e:
                 self.logger.error(f"Error loading state: {e}")
-                self.seen_charges = set()
-                self.seen_dockets = set()
-                self.seen_documents = set()
-                self.case_info = {}
-    
-    def _save_state(self):
-        """Save current state to file"""
+
+        # Last resort: the .bak rotated aside by the previous successful
+        # snapshot, in case the main file is missing, empty, or corrupt
+        if data is None:
+            for bak in (msgpack_file.with_suffix('.msgpack.bak'),
+                        self.data_file.with_suffix(self.data_file.suffix + '.bak')):
+                if not bak.exists():
+                    continue
+                try:
+                    if '.msgpack' in bak.name and msgpack is not None:
+                        with open(bak, 'rb') as f:
+                            data = msgpack.unpackb(f.read(), raw=False)
+                    else:
+                        with open(bak, 'r') as f:
+                            data = json.load(f)
+                    self.logger.warning(f"Recovered state from backup {bak.name}")
+                    break
+                except Exception as e:
+                    self.logger.error(f"Error loading backup state {bak.name}: {e}")
+
+        if data is None:
+            self._replay_journal()
+            return
+
+        try:
+            self.seen_charges = set(data.get('seen_charges', []))
+            self.seen_dockets = set(data.get('seen_dockets', []))
+            self.seen_documents = set(data.get('seen_documents', []))
+            self.seen_document_hashes = set(data.get('seen_document_hashes', []))
+            # Reconstruct case_info
+            for case_num, case_data in data.get('case_info', {}).items():
+                self.case_info[case_num] = CaseInfo(**case_data)
+            # Reconstruct ICE status
+            ice_data = data.get('ice_status')
+            if ice_data:
+                self.ice_status = IceDetaineeStatus(**ice_data)
+            self.ice_check_failures = data.get('ice_check_failures', 0)
+            self._case_page_sig = {k: tuple(v) for k, v in
+                                   data.get('case_page_sig', {}).items()}
+            self.logger.info(f"Loaded {len(self.seen_charges)} seen charges, "
+                           f"{len(self.seen_dockets)} seen dockets, "
+                           f"{len(self.seen_documents)} downloaded documents, "
+                           f"{len(self.case_info)} tracked cases")
+        except Exception as e:
+            self.logger.error(f"Error loading state: {e}")
+            self.seen_charges = set()
+            self.seen_dockets = set()
+            self.seen_documents = set()
+            self.case_info = {}
+
+        self._replay_journal()
+
+    def _replay_journal(self):
+        """Replay hashes journaled since the last snapshot into the seen sets"""
+        if self.skip_state or not self._journal_file.exists():
+            return
+
+        targets = {
+            'charge': self.seen_charges,
+            'docket': self.seen_dockets,
+            'document': self.seen_documents,
+            'dochash': self.seen_document_hashes
+        }
+        replayed = 0
+        try:
+            with open(self._journal_file, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    kind, value = json.loads(line)
+                    if kind in targets:
+                        targets[kind].add(value)
+                        replayed += 1
+        except Exception as e:
+            self.logger.error(f"Error replaying journal: {e}")
+        if replayed:
+            self.logger.info(f"Replayed {replayed} journal entries since last snapshot")
+
+    def _note_seen(self, kind: str, value: str):
+        """
+        Append one newly-seen hash to the journal
+
+        This makes new entries durable without rewriting the whole state
+        file; a crash between snapshots will not re-alert on them. Inserts
+        are O(1) appends and lookups stay in-memory set membership, so
+        there is no per-case rewrite cost as the seen sets grow (an
+        embedded database would buy nothing over this at these sizes).
+
+        Args:
+            kind: One of 'charge', 'docket', 'document', 'dochash'
+            value: The hash / document id that was just marked seen
+        """
+        if self.skip_state:
+            return
+        try:
+            with self._journal_lock:
+                if self._journal is None:
+                    self._journal = open(self._journal_file, 'a')
+                self._journal.write(json.dumps([kind, value]) + '\n')
+                self._journal.flush()
+        except Exception as e:
+            self.logger.debug("Error writing journal: %s", e)
+
+    def _truncate_journal(self):
+        """Drop the journal once its contents are captured in a snapshot"""
+        try:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if self._journal_file.exists():
+                self._journal_file.unlink()
+        except Exception as e:
+            self.logger.debug("Error truncating journal: %s", e)
+
+    def _journal_outgrew_snapshot(self, snapshot_file: Path) -> bool:
+        """True when the journal is bigger than the snapshot it amends
+
+        Replaying is cheap, but once the append-only log outweighs the
+        snapshot itself compaction is overdue regardless of poll count.
+        """
+        try:
+            return (self._journal_file.exists()
+                    and self._journal_file.stat().st_size > snapshot_file.stat().st_size)
+        except OSError:
+            return False
+
+    def _state_dict(self) -> Dict:
+        """Build the serializable snapshot of current tracking state"""
+        return {
+            'seen_charges': list(self.seen_charges),
+            'seen_dockets': list(self.seen_dockets),
+            'seen_documents': list(self.seen_documents),
+            'seen_document_hashes': list(self.seen_document_hashes),
+            'case_info': {k: _record_dict(v) for k, v in self.case_info.items()},
+            'last_updated': datetime.now().isoformat(),
+            'defendant_first_name': self.defendant_first_name,
+            'defendant_last_name': self.defendant_last_name,
+            'defendant_sex': self.defendant_sex,
+            'ice_status': _record_dict(self.ice_status) if self.ice_status else None,
+            'ice_check_failures': self.ice_check_failures,
+            # Persisted so --once runs warm-start the unchanged-page skip
+            # instead of re-walking every document on the first cycle
+            'case_page_sig': {k: list(v) for k, v in self._case_page_sig.items()}
+        }
+
+    def _save_state(self, force: bool = False):
+        """
+        Save current state to file
+
+        Full snapshots are written only every SNAPSHOT_EVERY polls (or when
+        force=True); in between, newly-seen hashes are already durable via
+        the append-only journal, so the per-poll write cost stays tiny.
+        """
         if self.skip_state:
             self.logger.info("Skipping state saving (--all mode)")
             return
 
+        self._polls_since_snapshot += 1
+        snapshot_file = self.data_file.with_suffix('.msgpack') if msgpack is not None else self.data_file
+        if (not force and self._polls_since_snapshot < self.SNAPSHOT_EVERY
+                and snapshot_file.exists()
+                and not self._journal_outgrew_snapshot(snapshot_file)):
+            return
+
         try:
-            data = {
-                'seen_charges': list(self.seen_charges),
-                'seen_dockets': list(self.seen_dockets),
-                'seen_documents': list(self.seen_documents),
-                'case_info': {k: asdict(v) for k, v in self.case_info.items()},
-                'last_updated': datetime.now().isoformat(),
-                'defendant_first_name': self.defendant_first_name,
-                'defendant_last_name': self.defendant_last_name,
-                'defendant_sex': self.defendant_sex,
-                'ice_status': asdict(self.ice_status) if self.ice_status else None,
-                'ice_check_failures': self.ice_check_failures
-            }
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            data = self._state_dict()
+            # Write to a temp file and swap it in with os.replace so the
+            # on-disk snapshot is always either the old version or the
+            # complete new one - an interrupt mid-write can never leave a
+            # truncated file that wipes the seen_* sets on the next run
+            tmp_file = snapshot_file.with_suffix(snapshot_file.suffix + '.tmp')
+            if msgpack is not None:
+                with open(tmp_file, 'wb') as f:
+                    f.write(msgpack.packb(data, use_bin_type=True))
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                with open(tmp_file, 'w') as f:
+                    # Machine-read only - compact separators, no pretty-print
+                    json.dump(data, f, separators=(',', ':'))
+                    f.flush()
+                    os.fsync(f.fileno())
+            # Keep the previous good snapshot as .bak before swapping in
+            if snapshot_file.exists():
+                os.replace(snapshot_file, snapshot_file.with_suffix(snapshot_file.suffix + '.bak'))
+            os.replace(tmp_file, snapshot_file)
+            self._truncate_journal()
+            self._polls_since_snapshot = 0
         except Exception as e:
             self.logger.error(f"Error saving state: {e}")
 
+    def export_state_json(self) -> Path:
+        """Write the tracked state as indented JSON for human inspection"""
+        out_file = self.data_file.with_suffix('.export.json')
+        with open(out_file, 'w') as f:
+            json.dump(self._state_dict(), f, indent=2)
+        return out_file
+
     def _init_browser(self):
         """Initialize Playwright browser"""
         try:
-            self.logger.info("Initializing browser...")
-            self.playwright = sync_playwright().start()
-            self.browser = self.playwright.chromium.launch(headless=self.headless)
-            self.page = self.browser.new_page()
-            # Set a reasonable viewport size
-            self.page.set_viewport_size({"width": 1920, "height": 1080})
+            if self.browser is None:
+                self.logger.info("Initializing browser...")
+                self.playwright = sync_playwright().start()
+                self.browser = self.playwright.chromium.launch(headless=self.headless)
+                atexit.register(self._close_browser)
+            self._new_context()
             self.logger.info("Browser initialized successfully")
         except Exception as e:
             self.logger.error(f"Error initializing browser: {e}")
             raise
 
+    def _new_context(self):
+        """
+        Open a fresh BrowserContext (and page) for the next poll cycle
+
+        A new context costs ~50ms versus seconds for a full browser launch,
+        so the Chromium process is kept alive for the life of the monitor
+        and only the context - cookies, cache, open pages - is recycled
+        between cycles for isolation.
+        """
+        self._close_context()
+        self.context = self.browser.new_context(viewport={"width": 1920, "height": 1080})
+        # Context-level so viewer popups are covered too
+        self.context.on('response', self._on_pdf_response)
+        self.page = self.context.new_page()
+
+    def _close_context(self):
+        """Close the current BrowserContext, leaving the browser running"""
+        try:
+            if self.context:
+                self.context.close()
+        except Exception as e:
+            self.logger.debug("Error closing browser context: %s", e)
+        self.context = None
+        self.page = None
+
     def _take_screenshot(self, description: str = ""):
         """
         Take a screenshot and save it to the screenshots directory
@@ -315,27 +706,51 @@ class MiamiDadeCourtMonitor:
         try:
             self.screenshot_counter += 1
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            safe_desc = re.sub(r'[^\w\s-]', '', description)[:50] if description else "screenshot"
-            safe_desc = re.sub(r'[-\s]+', '-', safe_desc)
+            safe_desc = _SAFE_DESC_STRIP_RE.sub('', description)[:50] if description else "screenshot"
+            safe_desc = _SAFE_DESC_DASH_RE.sub('-', safe_desc)
             filename = f"{self.screenshot_counter:04d}_{timestamp}_{safe_desc}.png"
             filepath = self.screenshots_dir / filename
             self.page.screenshot(path=str(filepath), full_page=True)
-            self.logger.debug(f"📸 Screenshot saved: {filename}")
+            self.logger.debug("📸 Screenshot saved: %s", filename)
         except Exception as e:
-            self.logger.debug(f"Error taking screenshot: {e}")
+            self.logger.debug("Error taking screenshot: %s", e)
 
     def _close_browser(self):
-        """Close Playwright browser and cleanup"""
+        """Close Playwright browser and cleanup (idempotent; atexit-safe)"""
+        if self.browser is None and self.playwright is None:
+            return
         try:
-            if self.page:
-                self.page.close()
+            self._close_context()
             if self.browser:
                 self.browser.close()
             if self.playwright:
                 self.playwright.stop()
+            self.http.close()
             self.logger.info("Browser closed")
         except Exception as e:
             self.logger.error(f"Error closing browser: {e}")
+        finally:
+            self.browser = None
+            self.playwright = None
+            atexit.unregister(self._close_browser)
+
+    def _wait_visible(self, selector: str, timeout: int = 10000, fallback_sleep: float = 1.0):
+        """
+        Wait for a selector to appear instead of sleeping a fixed pad
+
+        Falls back to a short sleep only when the wait times out (e.g. a
+        page variant without the expected element), so the common fast case
+        proceeds as soon as the element is there.
+
+        Args:
+            selector: Playwright selector to wait for
+            timeout: Max wait in milliseconds
+            fallback_sleep: Pad in seconds if the selector never shows up
+        """
+        try:
+            self.page.wait_for_selector(selector, timeout=timeout)
+        except Exception:
+            time.sleep(fallback_sleep)
 
     def _perform_defendant_search(self):
         """
@@ -349,106 +764,86 @@ class MiamiDadeCourtMonitor:
         """
         try:
             self.logger.info("Navigating to search page...")
-            self.page.goto(self.SEARCH_URL, wait_until="networkidle", timeout=60000)
+            # domcontentloaded + an explicit wait for the element we need:
+            # networkidle never fires on pages with long-poll/analytics
+            # beacons and turns every navigation into the full 60s timeout
+            self.page.goto(self.SEARCH_URL, wait_until="domcontentloaded", timeout=15000)
+            self._wait_visible(
+                'a:has-text("Defendant"), button:has-text("Defendant"), [href*="defendant"]',
+                timeout=10000)
             self._take_screenshot("01-initial-search-page")
 
-            # Click on "Defendant" button/link
+            # Click on "Defendant" button/link. A combined CSS selector lets
+            # Playwright try all alternatives in one call with one timeout
+            # instead of paying a full timeout per missed selector.
             self.logger.info("Clicking Defendant search option...")
-            # Try multiple possible selectors for the Defendant button
-            defendant_selectors = [
-                'a:has-text("Defendant")',
-                'button:has-text("Defendant")',
-                '[href*="defendant"]',
-                'text=Defendant'
-            ]
-
             clicked = False
-            for selector in defendant_selectors:
+            try:
+                self.page.click(
+                    'a:has-text("Defendant"), button:has-text("Defendant"), [href*="defendant"]',
+                    timeout=10000
+                )
+                clicked = True
+            except:
+                # Last resort: the text engine matches bare text nodes too
                 try:
-                    self.page.click(selector, timeout=5000)
+                    self.page.click('text=Defendant', timeout=5000)
                     clicked = True
-                    self.logger.info(f"Clicked Defendant using selector: {selector}")
-                    self._take_screenshot("02-after-click-defendant")
-                    break
                 except:
-                    continue
+                    pass
 
             if not clicked:
                 self.logger.error("Could not find Defendant search button")
                 self._take_screenshot("02-error-defendant-button-not-found")
                 return False
 
+            self.logger.info("Clicked Defendant search option")
+            self._take_screenshot("02-after-click-defendant")
+
             # Wait for the form popup to appear
-            time.sleep(2)
+            self._wait_visible('input[name="firstName"], input[id*="first"], input[placeholder*="First"]',
+                               fallback_sleep=2)
 
             # Fill in the form
-            self.logger.info(f"Filling in search form for {self.defendant_first_name} {self.defendant_last_name}...")
+            self.logger.info(f"Filling in search form for {self.display_name}...")
 
             # First Name
-            first_name_selectors = [
-                'input[name="firstName"]',
-                'input[id*="first"]',
-                'input[placeholder*="First"]'
-            ]
-            for selector in first_name_selectors:
-                try:
-                    self.page.fill(selector, self.defendant_first_name, timeout=5000)
-                    self.logger.debug(f"Filled first name using: {selector}")
-                    self._take_screenshot("03-after-fill-first-name")
-                    break
-                except:
-                    continue
+            try:
+                self.page.fill('input[name="firstName"], input[id*="first"], input[placeholder*="First"]',
+                               self.defendant_first_name, timeout=10000)
+                self._take_screenshot("03-after-fill-first-name")
+            except Exception as e:
+                self.logger.debug("Could not fill first name: %s", e)
 
             # Last Name
-            last_name_selectors = [
-                'input[name="lastName"]',
-                'input[id*="last"]',
-                'input[placeholder*="Last"]'
-            ]
-            for selector in last_name_selectors:
-                try:
-                    self.page.fill(selector, self.defendant_last_name, timeout=5000)
-                    self.logger.debug(f"Filled last name using: {selector}")
-                    self._take_screenshot("04-after-fill-last-name")
-                    break
-                except:
-                    continue
+            try:
+                self.page.fill('input[name="lastName"], input[id*="last"], input[placeholder*="Last"]',
+                               self.defendant_last_name, timeout=10000)
+                self._take_screenshot("04-after-fill-last-name")
+            except Exception as e:
+                self.logger.debug("Could not fill last name: %s", e)
 
             # Sex dropdown
-            sex_selectors = [
-                'select[name="sex"]',
-                'select[id*="sex"]',
-                'select[name="gender"]'
-            ]
-            for selector in sex_selectors:
-                try:
-                    self.page.select_option(selector, self.defendant_sex, timeout=5000)
-                    self.logger.debug(f"Selected sex using: {selector}")
-                    self._take_screenshot("05-after-select-sex")
-                    break
-                except:
-                    continue
+            try:
+                self.page.select_option('select[name="sex"], select[id*="sex"], select[name="gender"]',
+                                        self.defendant_sex, timeout=10000)
+                self._take_screenshot("05-after-select-sex")
+            except Exception as e:
+                self.logger.debug("Could not select sex: %s", e)
 
             # Click Search button
             self.logger.info("Submitting search...")
-            search_button_selectors = [
-                'button:has-text("Search")',
-                'input[type="submit"]',
-                'button[type="submit"]',
-                '[value="Search"]'
-            ]
-
-            for selector in search_button_selectors:
-                try:
-                    self.page.click(selector, timeout=5000)
-                    self.logger.info(f"Clicked search using: {selector}")
-                    self._take_screenshot("06-after-click-search")
-                    break
-                except:
-                    continue
+            try:
+                self.page.click(
+                    'button:has-text("Search"), input[type="submit"], button[type="submit"], [value="Search"]',
+                    timeout=10000
+                )
+                self._take_screenshot("06-after-click-search")
+            except Exception as e:
+                self.logger.warning(f"Could not click search button: {e}")
 
             # Wait for results to load
-            time.sleep(3)
+            self._wait_visible('table tr td', timeout=15000, fallback_sleep=3)
             self.logger.info("Search submitted, waiting for results...")
             self._take_screenshot("07-search-results")
 
@@ -458,17 +853,69 @@ class MiamiDadeCourtMonitor:
             self.logger.error(f"Error performing defendant search: {e}")
             return False
 
+    def _open_case_list(self) -> bool:
+        """
+        Perform the defendant search and click the defendant result so the
+        case list popup is visible
+
+        Returns:
+            True if the case list popup was opened
+        """
+        if not self._perform_defendant_search():
+            self.logger.error("Failed to perform defendant search")
+            return False
+
+        # Click on the defendant result (e.g., "DEUKER, RICARDO")
+        self.logger.info(f"Clicking on defendant result for {self.defendant_last_name}, {self.defendant_first_name}...")
+
+        defendant_name = f"{self.defendant_last_name.upper()}, {self.defendant_first_name.upper()}"
+        defendant_selectors = [
+            f'text={defendant_name}',
+            f':text("{self.defendant_last_name}")',
+            '[class*="defendant"]',
+            f'div:has-text("{self.defendant_last_name.upper()}")'
+        ]
+
+        # Wait once for the result to render, then probe each candidate with
+        # a free count() check - clicking blindly burned a full click
+        # timeout per selector that matched nothing
+        self._wait_visible(defendant_selectors[0], timeout=5000, fallback_sleep=0)
+
+        for selector in self._selector_order('defendant_result', defendant_selectors):
+            try:
+                loc = self.page.locator(selector)
+                if loc.count() == 0:
+                    self.logger.debug("Selector %s matched nothing", selector)
+                    continue
+                loc.first.click(timeout=2000)
+                self.logger.info(f"Clicked defendant result using: {selector}")
+                self._learned_selectors['defendant_result'] = selector
+                self._take_screenshot("08-after-click-defendant-result")
+                # Wait for the popup with case information to appear
+                self._wait_visible('table tr td', fallback_sleep=2)
+                return True
+            except Exception as click_err:
+                self.logger.debug("Selector %s failed: %s", selector, click_err)
+                continue
+
+        self.logger.error("Could not find defendant result to click")
+        self._take_screenshot("08-error-defendant-result-not-found")
+        return False
+
     def _generate_charge_hash(self, case_number: str, seq_num: str,
-                             charge_desc: str, charge_type: str) -> str:
+                             charge_desc: str, charge_type: str) -> int:
         """Generate unique hash for a charge"""
         content = f"{case_number}|{seq_num}|{charge_desc}|{charge_type}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        # A 64-bit int key: plenty for uniqueness at this scale, far
+        # smaller in memory and on disk than the old hex-digest strings,
+        # and both JSON and msgpack serialize it natively
+        return int.from_bytes(hashlib.blake2b(content.encode(), digest_size=8).digest(), 'big')
 
     def _generate_docket_hash(self, case_number: str, din: str,
-                             date: str, docket_desc: str) -> str:
+                             date: str, docket_desc: str) -> int:
         """Generate unique hash for a docket entry"""
         content = f"{case_number}|{din}|{date}|{docket_desc}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        return int.from_bytes(hashlib.blake2b(content.encode(), digest_size=8).digest(), 'big')
     
     def _extract_case_links(self) -> List[Dict[str, str]]:
         """
@@ -485,47 +932,16 @@ class MiamiDadeCourtMonitor:
         cases = []
 
         try:
-            # Perform the defendant search
-            if not self._perform_defendant_search():
-                self.logger.error("Failed to perform defendant search")
-                return cases
-
-            # Click on the defendant result (e.g., "DEUKER, RICARDO")
-            self.logger.info(f"Clicking on defendant result for {self.defendant_last_name}, {self.defendant_first_name}...")
-
-            # Try to click on the defendant name
-            defendant_name = f"{self.defendant_last_name.upper()}, {self.defendant_first_name.upper()}"
-            defendant_selectors = [
-                f'text={defendant_name}',
-                f':text("{self.defendant_last_name}")',
-                '[class*="defendant"]',
-                f'div:has-text("{self.defendant_last_name.upper()}")'
-            ]
-
-            clicked_defendant = False
-            for selector in defendant_selectors:
-                try:
-                    self.page.click(selector, timeout=5000)
-                    self.logger.info(f"Clicked defendant result using: {selector}")
-                    self._take_screenshot("08-after-click-defendant-result")
-                    clicked_defendant = True
-                    break
-                except:
-                    continue
-
-            if not clicked_defendant:
-                self.logger.error("Could not find defendant result to click")
-                self._take_screenshot("08-error-defendant-result-not-found")
+            # Perform the search and open the defendant's case list popup
+            if not self._open_case_list():
                 return cases
 
-            # Wait for the popup with case information to appear
-            time.sleep(2)
             self.logger.info("Extracting cases from popup...")
             self._take_screenshot("09-case-popup-opened")
 
             # Get the rendered HTML
             html = self.page.content()
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER, parse_only=_TABLES_ONLY)
 
             # Find the table with case information in the popup
             # The popup should have headers: Case, Filed Date, Closed Date, First Charge, Balance Due
@@ -538,6 +954,8 @@ class MiamiDadeCourtMonitor:
             self.logger.info(f"Found {len(rows)} rows in case table")
 
             for row in rows:
+                if row.find('td') is None:  # Header/decoration row
+                    continue
                 cells = row.find_all('td')
                 if len(cells) >= 4:  # Need at least Case, Filed Date, Closed Date, First Charge
                     try:
@@ -555,8 +973,7 @@ class MiamiDadeCourtMonitor:
                             case_href = case_link.get('href', '')
                         else:
                             # No link - extract case number from text (e.g., "F-25-024957")
-                            import re
-                            match = re.search(r'(F-\d{2}-\d+)', case_text)
+                            match = _CASE_NUM_RE.search(case_text)
                             if match:
                                 case_number = match.group(1)
                             else:
@@ -567,7 +984,7 @@ class MiamiDadeCourtMonitor:
                             case_href = None
 
                         if not case_number:
-                            self.logger.debug(f"Could not extract case number from: {case_text[:50]}")
+                            self.logger.debug("Could not extract case number from: %s", case_text[:50])
                             continue
 
                         # Build case URL
@@ -577,8 +994,10 @@ class MiamiDadeCourtMonitor:
                             else:
                                 case_url = case_href
                         else:
-                            # No href - will click on case number text later
-                            case_url = f"{self.BASE_URL}/case/{case_number}"
+                            # No href - leave empty so _fetch_case_details
+                            # clicks the case number instead of navigating
+                            # to a guessed URL the SPA may 404 on
+                            case_url = ""
 
                         # Extract other fields
                         filed_date = cells[1].get_text().strip() if len(cells) > 1 else ""
@@ -595,19 +1014,168 @@ class MiamiDadeCourtMonitor:
                             'balance_due': balance_due
                         })
 
-                        self.logger.debug(f"Found case: {case_number}")
+                        self.logger.debug("Found case: %s", case_number)
 
                     except Exception as e:
-                        self.logger.debug(f"Error parsing case row: {e}")
+                        self.logger.debug("Error parsing case row: %s", e)
                         continue
 
         except Exception as e:
             self.logger.error(f"Error extracting case links: {e}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Traceback:", exc_info=True)
 
         return cases
-    
+
+    # JS run inside the page to flatten a table's data rows. Returns one
+    # object per <tr> that has <td> cells: its cell texts, whether the first
+    # cell carries a document indicator, and any link href in the first cell.
+    _TABLE_ROWS_JS = (
+        "rows => rows.filter(r => r.querySelector('td')).map(r => {"
+        "  const cells = Array.from(r.querySelectorAll('td'));"
+        "  const first = cells[0];"
+        "  const link = first ? first.querySelector('a[href]') : null;"
+        "  return {"
+        "    cells: cells.map(c => c.innerText.trim()),"
+        "    has_document: !!(first && first.querySelector("
+        "      'img, a, svg, span[role=\"button\"]')),"
+        "    document_url: link ? link.getAttribute('href') : ''"
+        "  };"
+        "})"
+    )
+
+    def _extract_table_rows(self, table_selector: str, header_needles: tuple,
+                            exclude_needles: tuple = ()) -> List[dict]:
+        """
+        Extract a table's data rows in a single in-browser evaluation
+
+        Args:
+            table_selector: Playwright CSS selector identifying the table
+            header_needles: Lowercase substrings that must all appear in the
+                table's header text (used by the BeautifulSoup fallback)
+            exclude_needles: Lowercase substrings that must NOT appear in the
+                table's header text (used by the BeautifulSoup fallback)
+
+        Returns:
+            List of dicts with 'cells' (list of cell texts), 'has_document'
+            and 'document_url' keys - one per data row, header rows skipped
+        """
+        try:
+            rows = self.page.eval_on_selector_all(f"{table_selector} tr", self._TABLE_ROWS_JS)
+            if rows:
+                return rows
+        except Exception as e:
+            self.logger.debug("In-page table extraction failed (%s): %s", table_selector, e)
+
+        # Fall back to parsing a DOM snapshot if the evaluation failed or
+        # matched nothing (e.g. the engine rejects the :has() selector)
+        return self._extract_table_rows_soup(header_needles, exclude_needles)
+
+    def _extract_table_rows_soup(self, header_needles: tuple,
+                                 exclude_needles: tuple = ()) -> List[dict]:
+        """BeautifulSoup fallback for _extract_table_rows using page.content()"""
+        html = self.page.content()
+        soup = BeautifulSoup(html, _SOUP_PARSER, parse_only=_TABLES_ONLY)
+
+        for table in soup.find_all('table'):
+            headers = table.find_all('th')
+            if not headers:
+                continue
+            header_text = ' '.join([h.get_text() for h in headers]).lower()
+            if not all(needle in header_text for needle in header_needles):
+                continue
+            if any(needle in header_text for needle in exclude_needles):
+                continue
+
+            rows = []
+            for row in table.find_all('tr'):
+                cells = row.find_all('td')
+                if not cells:
+                    continue  # Header row
+                first = cells[0]
+                link = first.find('a')
+                has_document = bool(
+                    first.find('img') or link or first.find('svg') or
+                    first.find('span', {'role': 'button'}))
+                rows.append({
+                    'cells': [c.get_text().strip() for c in cells],
+                    'has_document': has_document,
+                    'document_url': link.get('href', '') if link else ''
+                })
+            return rows
+
+        return []
+
+    def _table_visible(self, table_selector: str) -> bool:
+        """Return True if the given table is already present in the DOM"""
+        try:
+            return self.page.locator(table_selector).count() > 0
+        except Exception as e:
+            self.logger.debug("Table visibility check failed (%s): %s", table_selector, e)
+            return False
+
+    def _expand_charges_section(self, case_number: str):
+        """Click the CHARGES accordion header so its table renders"""
+        self.logger.info(f"Expanding CHARGES section for {case_number}...")
+
+        try:
+            # Try to click on CHARGES header to expand it
+            charges_selectors = [
+                'text=CHARGES',
+                ':has-text("CHARGES")',
+                '[class*="charges"]'
+            ]
+            clicked_charges = False
+            for selector in charges_selectors:
+                try:
+                    self.logger.debug("Trying CHARGES selector: %s", selector)
+                    self.page.click(selector, timeout=3000)
+                    self.logger.info(f"✓ Clicked CHARGES using: {selector}")
+                    self._take_screenshot(f"12-after-click-charges-{case_number}")
+                    clicked_charges = True
+                    self._wait_visible('table:has(th:has-text("Seq No"))', timeout=5000)
+                    break
+                except Exception as e:
+                    self.logger.debug("CHARGES selector %s failed: %s", selector, e)
+                    continue
+
+            if not clicked_charges:
+                self.logger.warning("Could not click CHARGES section - may already be expanded or not found")
+                self._take_screenshot(f"12-charges-not-clickable-{case_number}")
+        except Exception as e:
+            self.logger.warning(f"Error expanding CHARGES section: {e}")
+
+    def _expand_dockets_section(self, case_number: str):
+        """Click the DOCKETS accordion header so its table renders"""
+        self.logger.info(f"Expanding DOCKETS section for {case_number}...")
+
+        try:
+            # Try to click on DOCKETS header to expand it
+            dockets_selectors = [
+                'text=DOCKETS',
+                ':has-text("DOCKETS")',
+                '[class*="dockets"]'
+            ]
+            clicked_dockets = False
+            for selector in dockets_selectors:
+                try:
+                    self.logger.debug("Trying DOCKETS selector: %s", selector)
+                    self.page.click(selector, timeout=3000)
+                    self.logger.info(f"✓ Clicked DOCKETS using: {selector}")
+                    self._take_screenshot(f"13-after-click-dockets-{case_number}")
+                    clicked_dockets = True
+                    self._wait_visible('table:has(th:has-text("Din"))', timeout=5000)
+                    break
+                except Exception as e:
+                    self.logger.debug("DOCKETS selector %s failed: %s", selector, e)
+                    continue
+
+            if not clicked_dockets:
+                self.logger.warning("Could not click DOCKETS section - may already be expanded or not found")
+                self._take_screenshot(f"13-dockets-not-clickable-{case_number}")
+        except Exception as e:
+            self.logger.warning(f"Error expanding DOCKETS section: {e}")
+
     def _fetch_case_details(self, case_url: str, case_number: str) -> tuple[List[Charge], List[DocketEntry], int, int]:
         """
         Fetch all charges and docket entries for a specific case
@@ -625,212 +1193,141 @@ class MiamiDadeCourtMonitor:
         total_documents_count = 0
 
         try:
-            # Click on the case number link to view docket details
-            self.logger.info(f"Clicking on case {case_number} to view docket...")
-
-            # First check if the case number is visible on the page
-            html = self.page.content()
-            if case_number in html:
-                self.logger.debug(f"Case number {case_number} found in page content")
-            else:
-                self.logger.warning(f"Case number {case_number} NOT found in page content!")
-                self.logger.debug(f"Page contains: {html[:500]}...")
-
-            case_link_selectors = [
-                f'a:has-text("{case_number}")',
-                f'text={case_number}',
-                f'[href*="{case_number}"]'
-            ]
+            opened_case = False
 
-            clicked_case = False
-            for selector in case_link_selectors:
+            # Navigate straight to the case when its URL is known - this is
+            # what makes the re-search/re-click dance between cases
+            # unnecessary for the callers
+            if case_url:
                 try:
-                    self.logger.debug(f"Trying selector: {selector}")
-                    self.page.click(selector, timeout=5000)
-                    self.logger.info(f"✓ Clicked case {case_number} using: {selector}")
-                    self._take_screenshot(f"10-after-click-case-{case_number}")
-                    clicked_case = True
-                    break
+                    self.logger.info(f"Navigating directly to case {case_number}...")
+                    self._throttle_navigation()
+                    # The CHARGES wait below confirms the page rendered;
+                    # networkidle would stall on pages with open beacons
+                    response = self.page.goto(case_url, wait_until="domcontentloaded", timeout=15000)
+                    # goto does not raise on an HTTP error page; fall back
+                    # to the click path rather than scraping a 404 shell
+                    if response is not None and not response.ok:
+                        self.logger.debug("Direct navigation to %s returned %s",
+                                          case_url, response.status)
+                    else:
+                        self._take_screenshot(f"10-after-navigate-case-{case_number}")
+                        opened_case = True
                 except Exception as e:
-                    self.logger.debug(f"Selector {selector} failed: {e}")
-                    continue
+                    self.logger.debug("Direct navigation to %s failed: %s", case_url, e)
 
-            if not clicked_case:
-                self.logger.warning(f"Could not click case {case_number}, trying URL navigation...")
-                self._take_screenshot(f"10-error-case-click-failed-{case_number}")
-                # Fallback: try to navigate directly if clicking didn't work
-                if case_url:
-                    self.page.goto(case_url, wait_until="networkidle", timeout=60000)
-                    self._take_screenshot(f"10-after-navigate-case-{case_number}")
-                else:
-                    self.logger.error(f"No URL available for case {case_number}, cannot navigate!")
-                    return charges, dockets
-
-            # Wait for case page to load
-            time.sleep(2)
-            self.logger.debug(f"Case page loaded, URL: {self.page.url}")
-            self._take_screenshot(f"11-case-page-loaded-{case_number}")
+            if not opened_case:
+                # Fall back to clicking the case number link on the case list
+                self.logger.info(f"Clicking on case {case_number} to view docket...")
 
-            # STEP 1: Expand and parse CHARGES section
-            self.logger.info(f"Expanding CHARGES section for {case_number}...")
-
-            # Check if CHARGES text exists on the page
-            html = self.page.content()
-            if 'CHARGES' in html.upper():
-                self.logger.debug("'CHARGES' text found in page")
-            else:
-                self.logger.warning("'CHARGES' text NOT found in page!")
-
-            try:
-                # Try to click on CHARGES header to expand it
-                charges_selectors = [
-                    'text=CHARGES',
-                    ':has-text("CHARGES")',
-                    '[class*="charges"]'
+                case_link_selectors = [
+                    f'a:has-text("{case_number}")',
+                    f'text={case_number}',
+                    f'[href*="{case_number}"]'
                 ]
-                clicked_charges = False
-                for selector in charges_selectors:
+
+                for selector in case_link_selectors:
                     try:
-                        self.logger.debug(f"Trying CHARGES selector: {selector}")
-                        self.page.click(selector, timeout=3000)
-                        self.logger.info(f"✓ Clicked CHARGES using: {selector}")
-                        self._take_screenshot(f"12-after-click-charges-{case_number}")
-                        clicked_charges = True
-                        time.sleep(1)
+                        self.logger.debug("Trying selector: %s", selector)
+                        self.page.click(selector, timeout=5000)
+                        self.logger.info(f"✓ Clicked case {case_number} using: {selector}")
+                        self._take_screenshot(f"10-after-click-case-{case_number}")
+                        opened_case = True
                         break
                     except Exception as e:
-                        self.logger.debug(f"CHARGES selector {selector} failed: {e}")
+                        self.logger.debug("Selector %s failed: %s", selector, e)
                         continue
 
-                if not clicked_charges:
-                    self.logger.warning("Could not click CHARGES section - may already be expanded or not found")
-                    self._take_screenshot(f"12-charges-not-clickable-{case_number}")
-            except Exception as e:
-                self.logger.warning(f"Error expanding CHARGES section: {e}")
+            if not opened_case:
+                self.logger.error(f"Could not open case {case_number} by URL or click!")
+                self._take_screenshot(f"10-error-case-open-failed-{case_number}")
+                return charges, dockets, new_documents_count, total_documents_count
 
-            # Parse CHARGES table
-            html = self.page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Find all tables and look for the one with charges
-            for table in soup.find_all('table'):
-                headers = table.find_all('th')
-                if headers:
-                    header_text = ' '.join([h.get_text() for h in headers]).lower()
-                    if 'seq no' in header_text and 'charge' in header_text:
-                        # This is the charges table
-                        self.logger.debug(f"Found CHARGES table for {case_number}")
-                        rows = table.find_all('tr')
-                        for row in rows[1:]:  # Skip header
-                            cells = row.find_all('td')
-                            if len(cells) >= 3:
-                                try:
-                                    seq_no = cells[0].get_text().strip()
-                                    charge_desc = cells[1].get_text().strip()
-                                    charge_type = cells[2].get_text().strip()
-                                    disposition = cells[3].get_text().strip() if len(cells) > 3 else ""
-
-                                    charge = Charge(
-                                        case_number=case_number,
-                                        sequence_number=seq_no,
-                                        charge_description=charge_desc,
-                                        charge_type=charge_type,
-                                        disposition=disposition,
-                                        timestamp_found=datetime.now().isoformat()
-                                    )
-                                    charges.append(charge)
-                                    self.logger.debug(f"Found charge: {seq_no} - {charge_desc}")
-                                except Exception as e:
-                                    self.logger.debug(f"Error parsing charge row: {e}")
-                        break
-
-            # STEP 2: Expand and parse DOCKETS section
-            self.logger.info(f"Expanding DOCKETS section for {case_number}...")
+            # Wait for case page to load
+            self._wait_visible('text=CHARGES', fallback_sleep=2)
+            self.logger.debug("Case page loaded, URL: %s", self.page.url)
+            self._take_screenshot(f"11-case-page-loaded-{case_number}")
 
-            # Check if DOCKETS text exists on the page
-            html = self.page.content()
-            if 'DOCKETS' in html.upper():
-                self.logger.debug("'DOCKETS' text found in page")
+            # STEP 1: Expand CHARGES section (skip the click entirely if the
+            # table is already in the DOM - sections often load pre-expanded)
+            if self._table_visible('table:has(th:has-text("Seq No"))'):
+                self.logger.info(f"CHARGES section already expanded for {case_number}")
             else:
-                self.logger.warning("'DOCKETS' text NOT found in page!")
+                self._expand_charges_section(case_number)
 
-            try:
-                # Try to click on DOCKETS header to expand it
-                dockets_selectors = [
-                    'text=DOCKETS',
-                    ':has-text("DOCKETS")',
-                    '[class*="dockets"]'
-                ]
-                clicked_dockets = False
-                for selector in dockets_selectors:
+            # STEP 2: Expand DOCKETS section
+            if self._table_visible('table:has(th:has-text("Din"))'):
+                self.logger.info(f"DOCKETS section already expanded for {case_number}")
+            else:
+                self._expand_dockets_section(case_number)
+
+            # STEP 3: Pull both tables in one in-browser evaluation each, so
+            # only the cell text crosses the Playwright IPC boundary instead
+            # of serializing the whole rendered DOM with page.content().
+            # One epoch timestamp per case - cheaper to take, compare, and
+            # serialize than a per-row 26-char ISO string
+            found_at = int(time.time())
+
+            charge_rows = self._extract_table_rows(
+                'table:has(th:has-text("Seq No")):has(th:has-text("Charge"))',
+                ('seq no', 'charge'))
+            if charge_rows:
+                self.logger.debug("Found CHARGES table for %s", case_number)
+            for row in charge_rows:
+                cells = row['cells']
+                if len(cells) >= 3:
                     try:
-                        self.logger.debug(f"Trying DOCKETS selector: {selector}")
-                        self.page.click(selector, timeout=3000)
-                        self.logger.info(f"✓ Clicked DOCKETS using: {selector}")
-                        self._take_screenshot(f"13-after-click-dockets-{case_number}")
-                        clicked_dockets = True
-                        time.sleep(1)
-                        break
+                        seq_no = cells[0]
+                        charge_desc = cells[1]
+                        charge_type = cells[2]
+                        disposition = cells[3] if len(cells) > 3 else ""
+
+                        charge = Charge(
+                            case_number=case_number,
+                            sequence_number=seq_no,
+                            charge_description=charge_desc,
+                            charge_type=charge_type,
+                            disposition=disposition,
+                            timestamp_found=found_at
+                        )
+                        charges.append(charge)
+                        self.logger.debug("Found charge: %s - %s", seq_no, charge_desc)
                     except Exception as e:
-                        self.logger.debug(f"DOCKETS selector {selector} failed: {e}")
-                        continue
-
-                if not clicked_dockets:
-                    self.logger.warning("Could not click DOCKETS section - may already be expanded or not found")
-                    self._take_screenshot(f"13-dockets-not-clickable-{case_number}")
-            except Exception as e:
-                self.logger.warning(f"Error expanding DOCKETS section: {e}")
-
-            # Parse DOCKETS table
-            html = self.page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Find all tables and look for the one with dockets
-            for table in soup.find_all('table'):
-                headers = table.find_all('th')
-                if headers:
-                    header_text = ' '.join([h.get_text() for h in headers]).lower()
-                    if 'din' in header_text and 'docket' in header_text:
-                        # This is the dockets table
-                        self.logger.debug(f"Found DOCKETS table for {case_number}")
-                        rows = table.find_all('tr')
-                        for row in rows[1:]:  # Skip header
-                            cells = row.find_all('td')
-                            if len(cells) >= 4:
-                                try:
-                                    # Columns: View Image, Din, Date, Book/Page, Docket
-                                    # Check if first cell has a "View Docket Image" link/icon
-                                    has_document = False
-                                    view_image_cell = cells[0]
-
-                                    # Look for document indicators: img, a, svg tags, or span with role="button"
-                                    if (view_image_cell.find('img') or
-                                        view_image_cell.find('a') or
-                                        view_image_cell.find('svg') or
-                                        view_image_cell.find('span', {'role': 'button', 'aria-label': 'View Docket Image'})):
-                                        # Check for image or link in the first column
-                                        has_document = True
-                                        self.logger.debug(f"Document available for Din {cells[1].get_text().strip()}")
-
-                                    din = cells[1].get_text().strip()
-                                    date = cells[2].get_text().strip()
-                                    book_page = cells[3].get_text().strip() if len(cells) > 3 else ""
-                                    docket_desc = cells[4].get_text().strip() if len(cells) > 4 else ""
-
-                                    docket = DocketEntry(
-                                        case_number=case_number,
-                                        din=din,
-                                        date=date,
-                                        docket_description=docket_desc,
-                                        book_page=book_page,
-                                        timestamp_found=datetime.now().isoformat(),
-                                        has_document=has_document
-                                    )
-                                    dockets.append(docket)
-                                    self.logger.debug(f"Found docket: {din} - {docket_desc[:50]}")
-                                except Exception as e:
-                                    self.logger.debug(f"Error parsing docket row: {e}")
-                        break
+                        self.logger.debug("Error parsing charge row: %s", e)
+
+            docket_rows = self._extract_table_rows(
+                'table:has(th:has-text("Din")):has(th:has-text("Docket"))',
+                ('din', 'docket'))
+            if docket_rows:
+                self.logger.debug("Found DOCKETS table for %s", case_number)
+            for row in docket_rows:
+                cells = row['cells']
+                if len(cells) >= 4:
+                    try:
+                        # Columns: View Image, Din, Date, Book/Page, Docket
+                        has_document = row['has_document']
+                        if has_document:
+                            self.logger.debug("Document available for Din %s", cells[1])
+
+                        din = cells[1]
+                        date = cells[2]
+                        book_page = cells[3] if len(cells) > 3 else ""
+                        docket_desc = cells[4] if len(cells) > 4 else ""
+
+                        docket = DocketEntry(
+                            case_number=case_number,
+                            din=din,
+                            date=date,
+                            docket_description=docket_desc,
+                            book_page=book_page,
+                            timestamp_found=found_at,
+                            has_document=has_document,
+                            document_url=row['document_url']
+                        )
+                        dockets.append(docket)
+                        self.logger.debug("Found docket: %s - %s", din, docket_desc[:50])
+                    except Exception as e:
+                        self.logger.debug("Error parsing docket row: %s", e)
 
             # Log summary of what was found
             self.logger.info(f"✓ Extracted {len(charges)} charge(s) and {len(dockets)} docket(s) from {case_number}")
@@ -838,25 +1335,130 @@ class MiamiDadeCourtMonitor:
             if not charges and not dockets:
                 self.logger.warning(f"No charges or dockets found for {case_number}")
 
-            # Download documents if enabled and documents are available
-            if self.download_documents and any(d.has_document for d in dockets):
-                new_docs, total_docs = self._download_case_documents(case_number, dockets)
-                new_documents_count += new_docs
-                total_documents_count += total_docs
+            # Signature over the extracted cells (not the raw HTML, which
+            # carries volatile framework markup): when it matches the last
+            # poll neither table changed, so the click-heavy document
+            # passes below can be skipped outright
+            # hexdigest, not raw bytes: the signature lands in the JSON
+            # state fallback and --export-json, which are text formats
+            page_sig = hashlib.blake2b(
+                json.dumps([r['cells'] for r in charge_rows + docket_rows]).encode(),
+                digest_size=8).hexdigest()
+            prev_sig, prev_total = self._case_page_sig.get(case_number, (None, 0))
 
-            # Check for "Extra Documents" tab
             if self.download_documents:
-                new_docs, total_docs = self._check_extra_documents_tab(case_number)
-                new_documents_count += new_docs
-                total_documents_count += total_docs
+                if page_sig == prev_sig:
+                    self.logger.info(f"⏭️  Case {case_number} tables unchanged - skipping document scan")
+                    total_documents_count = prev_total
+                else:
+                    # Download documents if any are available
+                    if any(d.has_document for d in dockets):
+                        new_docs, total_docs = self._download_case_documents(case_number, dockets)
+                        new_documents_count += new_docs
+                        total_documents_count += total_docs
+
+                    # Check for "Extra Documents" tab
+                    new_docs, total_docs = self._check_extra_documents_tab(case_number)
+                    new_documents_count += new_docs
+                    total_documents_count += total_docs
+
+                    if new_documents_count == 0:
+                        self._case_page_sig[case_number] = (page_sig, total_documents_count)
+                    else:
+                        # New documents this pass - leave the signature unset
+                        # so the next poll re-runs the (now cheap) scan and
+                        # retries anything that failed to download
+                        self._case_page_sig.pop(case_number, None)
 
         except Exception as e:
             self.logger.error(f"Error fetching case details for {case_number}: {e}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Traceback:", exc_info=True)
 
         return charges, dockets, new_documents_count, total_documents_count
 
+    def _selector_order(self, role: str, selectors: List[str]) -> List[str]:
+        """Order a selector fallback chain with the last winner first"""
+        learned = self._learned_selectors.get(role)
+        if learned and learned in selectors:
+            return [learned] + [s for s in selectors if s != learned]
+        return list(selectors)
+
+    def _throttle_navigation(self):
+        """Enforce the global politeness floor before a case navigation
+
+        All workers draw from the same clock, so concurrent case fetches
+        stay spaced at CASE_NAV_MIN_INTERVAL without serializing behind
+        a fixed per-case sleep.
+        """
+        with self._nav_state['lock']:
+            now = time.monotonic()
+            wait = self._nav_state['next'] - now
+            self._nav_state['next'] = max(now, self._nav_state['next']) + self.CASE_NAV_MIN_INTERVAL
+        if wait > 0:
+            time.sleep(wait)
+
+    def _download_backoff(self):
+        """Jittered exponential backoff after a failed document download"""
+        delay = min(0.5 * (2 ** self._download_failures), 8.0)
+        delay *= random.uniform(0.8, 1.2)
+        self._download_failures += 1
+        self.logger.debug("Backing off %.1fs after download failure", delay)
+        time.sleep(delay)
+
+    def _on_pdf_response(self, response):
+        """Response listener: remember URLs that look like court PDFs"""
+        try:
+            url = response.url
+            lowered = url.lower()
+            if '.pdf' in lowered or 'docketimage' in lowered or 'viewdocument' in lowered:
+                self._recent_pdf_urls.append(url)
+        except Exception:
+            pass
+
+    def _pop_recent_pdf_url(self) -> str:
+        """Take the most recently captured PDF URL, if any"""
+        try:
+            return self._recent_pdf_urls.pop()
+        except IndexError:
+            return ''
+
+    def _document_filepath(self, case_number: str, desc: str,
+                           reserved: Optional[set] = None) -> tuple[str, Path]:
+        """
+        Build a filesystem-safe, collision-free path for a case document
+
+        Args:
+            case_number: The case number (used as subdirectory)
+            desc: Docket/document description used for the filename
+            reserved: Optional set of paths already claimed by a parallel
+                batch whose files do not exist on disk yet
+
+        Returns:
+            Tuple of (filename, filepath)
+        """
+        case_dir = self.documents_dir / case_number
+        case_dir.mkdir(parents=True, exist_ok=True)
+
+        # Clean description to be filesystem-safe (no need for case_number
+        # prefix since it's in the folder name)
+        safe_desc = _SAFE_DESC_STRIP_RE.sub('', desc)
+        safe_desc = _SAFE_DESC_DASH_RE.sub('-', safe_desc)
+        safe_desc = safe_desc[:100]  # Limit length
+        filename = f"{safe_desc}.pdf"
+        filepath = case_dir / filename
+
+        # If file already exists, add a counter
+        counter = 1
+        while filepath.exists() or (reserved is not None and filepath in reserved):
+            filename = f"{safe_desc}-{counter}.pdf"
+            filepath = case_dir / filename
+            counter += 1
+
+        if reserved is not None:
+            reserved.add(filepath)
+        return filename, filepath
+
     def _download_case_documents(self, case_number: str, dockets: List[DocketEntry]) -> tuple[int, int]:
         """
         Download documents for dockets that have them available
@@ -868,37 +1470,32 @@ class MiamiDadeCourtMonitor:
         Returns:
             Tuple of (new_documents_count, total_documents_count)
         """
-        import os
-        import re
-
         new_documents_count = 0
         total_documents_count = 0
 
         self.logger.info(f"Checking for documents to download in {case_number}...")
 
-        # Ensure DOCKETS section is expanded
+        # Ensure DOCKETS section is expanded - bail without clicking (or
+        # sleeping) when the docket table is already rendered
         try:
-            # Look for DOCKETS button/tab and click it if not already expanded
-            dockets_selectors = [
-                ':has-text("DOCKETS")',
-                'text=DOCKETS',
-                'button:has-text("DOCKETS")',
-            ]
-
-            for selector in dockets_selectors:
-                try:
-                    dockets_btn = self.page.locator(selector)
-                    if dockets_btn.count() > 0:
-                        self.logger.debug(f"Clicking DOCKETS section to expand...")
-                        dockets_btn.first.click(timeout=3000)
-                        time.sleep(1)  # Wait for expansion
-                        self.logger.debug("DOCKETS section expanded")
-                        break
-                except:
-                    pass
+            if not self._table_visible('table:has(th:has-text("Din"))'):
+                dockets_btn = self.page.locator(
+                    'button:has-text("DOCKETS"), [role="button"]:has-text("DOCKETS")')
+                if dockets_btn.count() == 0:
+                    dockets_btn = self.page.locator('text=DOCKETS')
+                if dockets_btn.count() > 0 and dockets_btn.first.get_attribute('aria-expanded') != 'true':
+                    self.logger.debug("Clicking DOCKETS section to expand...")
+                    dockets_btn.first.click(timeout=3000)
+                    # Wait ends the instant the table renders, not a fixed 1s
+                    self._wait_visible('table:has(th:has-text("Din"))', timeout=3000, fallback_sleep=0)
+                    self.logger.debug("DOCKETS section expanded")
         except Exception as e:
-            self.logger.debug(f"Error expanding DOCKETS section: {e}")
+            self.logger.debug("Error expanding DOCKETS section: %s", e)
 
+        # Collect pending (not-yet-seen) documents once. Every pending entry
+        # counts as "new" whether or not the download succeeds, matching the
+        # previous per-entry accounting.
+        pending = []
         for docket in dockets:
             if not docket.has_document:
                 continue
@@ -911,209 +1508,332 @@ class MiamiDadeCourtMonitor:
 
             # Check if we've already downloaded this document
             if doc_id in self.seen_documents:
-                self.logger.debug(f"Document already downloaded: {doc_id}")
+                self.logger.debug("Document already downloaded: %s", doc_id)
                 continue
 
-            # This is a new document
-            new_documents_count += 1
-
+            pending.append((docket, doc_id))
+
+        new_documents_count = len(pending)
+
+        # Pass 1: rows that expose a direct PDF href can be fetched over
+        # plain HTTP in parallel, without driving the viewer UI at all
+        direct = [(d, doc_id) for d, doc_id in pending if d.document_url]
+        if direct:
+            reserved = set()
+            jobs = [(docket, doc_id) + self._document_filepath(case_number, docket.docket_description, reserved)
+                    for docket, doc_id in direct]
+            self.logger.info(f"Fetching {len(jobs)} document(s) directly over HTTP...")
+            # Cookies are read here, on the Playwright-owning thread: the
+            # sync API is thread-bound and raises from pool workers
+            cookies = self._browser_cookies()
+            with ThreadPoolExecutor(max_workers=min(self.download_concurrency, len(jobs))) as executor:
+                futures = {executor.submit(self._download_pdf_direct, docket.document_url, filepath, cookies):
+                           (docket, doc_id, filename)
+                           for docket, doc_id, filename, filepath in jobs}
+                for future in as_completed(futures):
+                    docket, doc_id, filename = futures[future]
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        self.logger.debug("Direct download worker failed for Din %s: %s", docket.din, e)
+                        success = False
+                    if success:
+                        self.seen_documents.add(doc_id)
+                        self._note_seen('document', doc_id)
+                        docket.document_downloaded = True
+                        docket.document_filename = filename
+                        pending.remove((docket, doc_id))
+
+        # Pass 2: remaining documents need the React PDF Viewer flow, which
+        # drives the shared page and therefore stays sequential
+        for docket, doc_id in pending:
             try:
-                # Create case-specific subdirectory
-                case_dir = self.documents_dir / case_number
-                case_dir.mkdir(parents=True, exist_ok=True)
-
-                # Generate safe filename: docket_description.pdf (no need for case_number prefix since it's in folder)
-                # Clean docket description to be filesystem-safe
-                safe_desc = re.sub(r'[^\w\s-]', '', docket.docket_description)
-                safe_desc = re.sub(r'[-\s]+', '-', safe_desc)
-                safe_desc = safe_desc[:100]  # Limit length
-                filename = f"{safe_desc}.pdf"
-                filepath = case_dir / filename
-
-                # If file already exists, add a counter
-                counter = 1
-                original_filepath = filepath
-                while filepath.exists():
-                    filename = f"{safe_desc}-{counter}.pdf"
-                    filepath = case_dir / filename
-                    counter += 1
+                filename, filepath = self._document_filepath(case_number, docket.docket_description)
 
                 self.logger.info(f"Downloading document for Din {docket.din}: {case_number}/{filename}")
 
+                # Drop URLs captured for previous dockets so the fast path
+                # below cannot fetch the wrong document
+                self._recent_pdf_urls.clear()
+
                 # Strategy: Click "View Image" button, wait for viewer, click download button
-                self.logger.debug(f"Attempting to open document viewer for Din {docket.din}")
+                self.logger.debug("Attempting to open document viewer for Din %s", docket.din)
 
                 # Step 1: Find and click the "View Image" button
                 # Normalize description for matching: the parsed HTML may include
                 # characters (like '/') that the rendered page text omits
-                desc_search = re.sub(r'[^\w\s]', '', docket.docket_description[:30]).strip()
-                self.logger.debug(f"Looking for row with description: {desc_search}")
-
-                # Find all rows, check if they contain this docket description
-                rows = self.page.locator('table tr')
+                desc_search = _PUNCT_STRIP_RE.sub('', docket.docket_description[:30]).strip()
+                self.logger.debug("Looking for row with description: %s", desc_search)
+
+                # Find the matching row by pushing the text filter into the
+                # browser: has_text lets the engine skip non-matching rows
+                # instead of shipping every row's text back over CDP. The
+                # regex tolerates punctuation the rendered text may add or
+                # omit between any two characters of the description
+                desc_pattern = re.compile(r'[^\w\s]*'.join(re.escape(ch) for ch in desc_search))
+                rows = self.page.locator('table tr', has_text=desc_pattern)
                 clicked_view = False
+                downloaded_direct = False
                 viewer_page = None  # Will hold the popup page if opened
 
-                for i in range(rows.count()):
-                    row = rows.nth(i)
-                    row_text = re.sub(r'[^\w\s]', '', row.inner_text())
-
-                    # Check if this row contains the docket description
-                    if desc_search in row_text:
-                        self.logger.debug(f"Found matching row for Din {docket.din}")
+                if rows.count() > 0:
+                    row = rows.first
+                    self.logger.debug("Found matching row for Din %s", docket.din)
 
-                        # Click the view image button
-                        try:
-                            # Find all spans with View Docket Image in this row
-                            view_buttons = row.locator('span[role="button"][aria-label="View Docket Image"]')
-                            button_count = view_buttons.count()
-                            self.logger.debug(f"Found {button_count} View Image buttons in row")
+                    # Click the view image button
+                    try:
+                        # Find all spans with View Docket Image in this row
+                        view_buttons = row.locator('span[role="button"][aria-label="View Docket Image"]')
+                        button_count = view_buttons.count()
+                        self.logger.debug("Found %s View Image buttons in row", button_count)
 
-                            if button_count > 0:
-                                self.logger.debug(f"Clicking View Image button...")
+                        if button_count > 0:
+                            self.logger.debug("Clicking View Image button...")
 
-                                # Get current page count before click
-                                initial_pages = len(self.page.context.pages)
-                                current_url = self.page.url
+                            current_url = self.page.url
 
-                                # Try to scroll the button into view and click it
+                            # Try to scroll the button into view and click it
+                            try:
+                                # Scroll the row into view first
+                                row.scroll_into_view_if_needed()
+                                time.sleep(0.5)
+
+                                # Try the last button (usually desktop version)
+                                last_btn = view_buttons.last
+                                last_btn.scroll_into_view_if_needed()
+                                time.sleep(0.5)
+
+                                # Click, resolving a popup on the event
+                                # itself rather than polling page counts
+                                self.logger.debug("Clicking for React PDF Viewer...")
                                 try:
-                                    # Scroll the row into view first
-                                    row.scroll_into_view_if_needed()
-                                    time.sleep(0.5)
-
-                                    # Try the last button (usually desktop version)
-                                    last_btn = view_buttons.last
-                                    last_btn.scroll_into_view_if_needed()
-                                    time.sleep(0.5)
-
-                                    # Click and wait for React PDF Viewer to load
-                                    self.logger.debug("Clicking for React PDF Viewer...")
-                                    last_btn.dispatch_event('click', {'bubbles': True, 'cancelable': True})
+                                    with self.page.expect_popup(timeout=3000) as popup_info:
+                                        last_btn.dispatch_event('click', {'bubbles': True, 'cancelable': True})
+                                        clicked_view = True
+                                    viewer_page = popup_info.value
+                                    self.page = viewer_page
+                                    self.logger.debug("Viewer popup opened: %s", viewer_page.url)
+                                except Exception:
+                                    # No popup fired - the viewer loads inline
                                     clicked_view = True
-                                    self.logger.debug("Click event dispatched, waiting for React components...")
-
-                                    # Wait longer for React components to mount
-                                    time.sleep(2)
-
-                                    # Look for modal, overlay, or dialog that might contain the viewer
-                                    modal_selectors = [
-                                        '.modal',
-                                        '[role="dialog"]',
-                                        '.rpv-core__modal',
-                                        '.rpv-core__viewer',
-                                        'div[class*="modal"]',
-                                        'div[class*="dialog"]',
-                                        'div[class*="overlay"]',
-                                    ]
-
-                                    viewer_found = False
-                                    for modal_sel in modal_selectors:
-                                        modal = self.page.locator(modal_sel)
-                                        if modal.count() > 0:
-                                            self.logger.debug(f"Found modal/overlay with selector: {modal_sel}")
-                                            viewer_found = True
-                                            break
-
-                                    if not viewer_found:
-                                        # Check for new pages/tabs
-                                        all_pages = self.page.context.pages
-                                        if len(all_pages) > initial_pages:
-                                            viewer_page = all_pages[-1]
-                                            self.page = viewer_page
-                                            self.logger.debug(f"Switched to new page: {viewer_page.url}")
-                                            viewer_found = True
-                                except Exception as js_error:
-                                    self.logger.debug(f"JS click failed: {js_error}, trying regular click with force...")
+                                    self.logger.debug("No popup after click, waiting for inline viewer...")
                                     try:
+                                        self.page.locator('.rpv-default-layout__container').wait_for(state='attached', timeout=15000)
+                                    except Exception:
+                                        self.logger.debug("Viewer container not attached yet after click")
+
+                                # Look for modal, overlay, or dialog that might contain the viewer
+                                modal_selectors = [
+                                    '.modal',
+                                    '[role="dialog"]',
+                                    '.rpv-core__modal',
+                                    '.rpv-core__viewer',
+                                    'div[class*="modal"]',
+                                    'div[class*="dialog"]',
+                                    'div[class*="overlay"]',
+                                ]
+
+                                viewer_found = False
+                                for modal_sel in modal_selectors:
+                                    modal = self.page.locator(modal_sel)
+                                    if modal.count() > 0:
+                                        self.logger.debug("Found modal/overlay with selector: %s", modal_sel)
+                                        viewer_found = True
+                                        break
+
+                                if not viewer_found and viewer_page is not None:
+                                    viewer_found = True
+                            except Exception as js_error:
+                                self.logger.debug("JS click failed: %s, trying regular click with force...", js_error)
+                                try:
+                                    with self.page.expect_popup(timeout=3000) as popup_info:
                                         view_buttons.last.click(force=True, timeout=5000)
                                         clicked_view = True
-                                        self.logger.debug("Button clicked with force=True")
-                                    except Exception as force_error:
-                                        self.logger.debug(f"Force click also failed: {force_error}")
-
-                                # Don't wait - check immediately and then wait for viewer
-                                # Check if a new page opened
-                                current_pages = self.page.context.pages
-                                if len(current_pages) > initial_pages:
-                                    # New page/popup opened
-                                    viewer_page = current_pages[-1]  # Last page is the new one
-                                    self.logger.debug(f"New page opened: {viewer_page.url}")
+                                    viewer_page = popup_info.value
                                     self.page = viewer_page
-                                    self.logger.info(f"✓ Opened viewer in new page for Din {docket.din}")
-                                elif self.page.url != current_url:
-                                    # Current page navigated
-                                    self.logger.info(f"✓ Navigated to viewer page: {self.page.url}")
-                                else:
-                                    # Viewer might be loading inline - wait for React PDF Viewer components
-                                    self.logger.debug("Waiting for React PDF Viewer to load...")
-                                    try:
-                                        # Wait for the viewer container to appear (React PDF Viewer takes time to render)
-                                        self.page.locator('.rpv-default-layout__container, .rpv-core__viewer').wait_for(state='attached', timeout=15000)
-                                        self.logger.info(f"✓ React PDF Viewer loaded for Din {docket.din}")
+                                    self.logger.debug("Button clicked with force=True (popup opened)")
+                                except Exception as force_error:
+                                    self.logger.debug("Force click popup wait ended: %s", force_error)
+
+                            if viewer_page is not None:
+                                self.logger.info(f"✓ Opened viewer in new page for Din {docket.din}")
+                            elif self.page.url != current_url:
+                                # Current page navigated
+                                self.logger.info(f"✓ Navigated to viewer page: {self.page.url}")
+                            else:
+                                # Viewer might be loading inline - wait for React PDF Viewer components
+                                self.logger.debug("Waiting for React PDF Viewer to load...")
+                                try:
+                                    # Wait for the viewer container to appear (React PDF Viewer takes time to render)
+                                    self.page.locator('.rpv-default-layout__container, .rpv-core__viewer').wait_for(state='attached', timeout=15000)
+                                    self.logger.info(f"✓ React PDF Viewer loaded for Din {docket.din}")
+                                except:
+                                    self.logger.warning(f"React PDF Viewer did not load - trying to find PDF URL directly...")
 
-                                        # Wait an additional moment for full render
-                                        time.sleep(2)
+                                    # Try to extract PDF URL from page source and
+                                    # fetch it over the shared HTTP session
+                                    try:
+                                        page_content = self.page.content()
+                                        pdf_urls = _PDF_URL_RE.findall(page_content)
+                                        if pdf_urls:
+                                            self.logger.debug("Found potential PDF URLs: %s", pdf_urls[:3])
+                                            downloaded_direct = self._download_pdf_direct(pdf_urls[0], filepath)
                                     except:
-                                        self.logger.warning(f"React PDF Viewer did not load - trying to find PDF URL directly...")
+                                        pass
 
-                                        # Try to extract PDF URL from page source/network
-                                        try:
-                                            # Look for PDF URL in the page
-                                            pdf_url_pattern = r'(https?://[^\s<>"]+\.pdf[^\s<>"]*|/cjis/[^\s<>"]*docketimage[^\s<>"]*)'
-                                            page_content = self.page.content()
-                                            import re as re_module
-                                            pdf_urls = re_module.findall(pdf_url_pattern, page_content)
-                                            if pdf_urls:
-                                                self.logger.debug(f"Found potential PDF URLs: {pdf_urls[:3]}")
-                                        except:
-                                            pass
+                    except Exception as e:
+                        self.logger.debug("View button click failed: %s", e)
 
-                                break
-                        except Exception as e:
-                            self.logger.debug(f"View button click failed: {e}")
+                if not clicked_view and not downloaded_direct:
+                    raise Exception(f"Could not open viewer for Din {docket.din}")
 
-                        break
+                # Fast path: fetch the PDF over HTTP (browser cookies ride
+                # along) and skip the viewer toolbar dance entirely. The
+                # response listener usually captured the URL as the viewer
+                # loaded it; scanning page.content() is the fallback.
+                if not downloaded_direct:
+                    pdf_url = self._pop_recent_pdf_url()
+                    if pdf_url:
+                        downloaded_direct = self._download_pdf_direct(pdf_url, filepath)
+                if not downloaded_direct:
+                    try:
+                        pdf_urls = _PDF_URL_RE.findall(self.page.content())
+                        if pdf_urls:
+                            downloaded_direct = self._download_pdf_direct(pdf_urls[0], filepath)
+                    except Exception as e:
+                        self.logger.debug("PDF fast-path fetch failed: %s", e)
 
-                if not clicked_view:
-                    raise Exception(f"Could not open viewer for Din {docket.din}")
+                # The fast path leaves any opened viewer behind; close it so
+                # the next docket starts from the main page
+                if downloaded_direct and clicked_view:
+                    self._close_extra_pages()
 
-                # Use the consolidated React PDF Viewer download helper
-                if self._handle_react_pdf_viewer_download(filepath, viewer_page, f"Din {docket.din}"):
+                # Use the consolidated React PDF Viewer download helper unless
+                # the direct HTTP fetch already saved the file
+                if downloaded_direct or self._handle_react_pdf_viewer_download(filepath, viewer_page, f"Din {docket.din}"):
                     # Success!
                     self.seen_documents.add(doc_id)
+                    self._note_seen('document', doc_id)
                     docket.document_downloaded = True
                     docket.document_filename = filename
                 else:
                     raise Exception(f"Failed to download document for Din {docket.din}")
 
-                # Small delay between downloads
-                time.sleep(0.5)
+                # No pacing pad on success - back off only when the server
+                # actually pushes back
+                self._download_failures = 0
 
             except Exception as e:
                 self.logger.error(f"Error downloading document for Din {docket.din}: {e}")
-                import traceback
-                self.logger.debug(traceback.format_exc())
+                self._download_backoff()
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Traceback:", exc_info=True)
 
-                # Try to close any popup pages and return to main page
-                try:
-                    pages = self.page.context.pages
-                    # Close all pages except the first (main) page
-                    for i in range(len(pages) - 1, 0, -1):
-                        try:
-                            pages[i].close()
-                            self.logger.debug(f"Closed page {i}")
-                        except:
-                            pass
-                    # Return to main page
-                    if pages:
-                        self.page = pages[0]
-                        self.logger.debug("Returned to main page after error")
-                except Exception as cleanup_error:
-                    self.logger.debug(f"Error cleaning up pages: {cleanup_error}")
+                # Close any leaked popup pages and return to the main page
+                self._close_extra_pages()
 
         return new_documents_count, total_documents_count
 
+    def _close_extra_pages(self):
+        """Close any leaked viewer popups and point self.page at the main page"""
+        try:
+            pages = self.page.context.pages
+            for extra in pages[1:]:
+                try:
+                    extra.close()
+                except Exception:
+                    pass
+            if pages:
+                self.page = pages[0]
+        except Exception as e:
+            self.logger.debug("Error cleaning up pages: %s", e)
+
+    def _browser_cookies(self) -> Dict[str, str]:
+        """
+        Snapshot the browser context's cookies as a plain dict
+
+        Must run on the thread that owns the sync-Playwright objects -
+        pool workers get the snapshot passed in rather than touching the
+        context themselves.
+        """
+        cookies = {}
+        if self.page:
+            try:
+                cookies = {c['name']: c['value'] for c in self.page.context.cookies()}
+            except Exception as e:
+                self.logger.debug("Could not read browser cookies: %s", e)
+        return cookies
+
+    def _download_pdf_direct(self, url: str, filepath, cookies: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Download a PDF over plain HTTP using the shared session, reusing the
+        browser's cookies so viewer URLs that require the session still work
+
+        Args:
+            url: Absolute or site-relative URL of the PDF
+            filepath: Path object where to save the downloaded file
+            cookies: Pre-snapshotted browser cookies; taken fresh from the
+                context when omitted (callers on the Playwright thread)
+
+        Returns:
+            True if a PDF was saved to filepath
+        """
+        try:
+            if not url.startswith('http'):
+                url = urljoin(self.BASE_URL, url)
+
+            if cookies is None:
+                cookies = self._browser_cookies()
+
+            with self.http.get(url, cookies=cookies, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '').lower()
+                if 'pdf' not in content_type and 'octet-stream' not in content_type:
+                    self.logger.debug("Direct download skipped, unexpected content type: %s", content_type)
+                    return False
+                with open(filepath, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f)
+
+            if not self._register_downloaded_file(filepath):
+                return True  # Same bytes already stored under another name
+
+            self.logger.info(f"📥 Downloaded (direct): {filepath.name}")
+            return True
+        except Exception as e:
+            self.logger.debug("Direct download failed for %s: %s", url, e)
+            return False
+
+    def _register_downloaded_file(self, filepath) -> bool:
+        """
+        Content-hash a freshly saved PDF and drop byte-identical duplicates
+
+        The same PDF is often reachable under different descriptions (e.g.
+        from both the DOCKETS table and the Extra Documents tab), so the
+        (case, din, description) doc id alone misses repeats. Hashing the
+        stored bytes catches them regardless of how they were labelled.
+
+        Returns:
+            True if the file holds new content and was kept, False if it
+            duplicated an already-stored document and was removed
+        """
+        try:
+            content_hash = hashlib.blake2b(filepath.read_bytes(), digest_size=16).hexdigest()
+        except Exception as e:
+            self.logger.debug("Could not hash %s: %s", filepath, e)
+            return True
+
+        if content_hash in self.seen_document_hashes:
+            self.logger.info(f"\u267b\ufe0f  Duplicate content, removing {filepath.name}")
+            try:
+                filepath.unlink()
+            except OSError:
+                pass
+            return False
+
+        self.seen_document_hashes.add(content_hash)
+        self._note_seen('dochash', content_hash)
+        return True
+
     def _handle_react_pdf_viewer_download(self, filepath, viewer_page=None, doc_label="document") -> bool:
         """
         Handle React PDF Viewer interaction and download after view button is clicked.
@@ -1128,73 +1848,71 @@ class MiamiDadeCourtMonitor:
             True if download was successful, False otherwise
         """
         try:
-            # Step 1: Wait for viewer to fully load
-            self.logger.debug(f"Waiting for viewer to load...")
-            time.sleep(5)  # Allow viewer to fully load
-
-            # Step 2: Verify React PDF Viewer components are present
-            viewer_container = self.page.locator('.rpv-default-layout__container')
-            self.logger.debug(f"Viewer container count: {viewer_container.count()}")
-
-            # Debug: Log page URL and check for common viewer elements
-            self.logger.info(f"DEBUG: Current page URL: {self.page.url}")
-
-            # Check for various viewer elements
-            for selector in ['.rpv-default-layout__toolbar', '.rpv-toolbar__right', 'button[aria-label="Download"]', '[data-testid="get-file__download-button"]']:
-                count = self.page.locator(selector).count()
-                self.logger.info(f"DEBUG: Selector '{selector}' count: {count}")
+            # Step 1: Wait only as long as the viewer actually takes to
+            # mount - polling for the toolbar returns in well under a
+            # second on fast loads instead of a fixed 5s sleep
+            self.logger.debug("Waiting for viewer to load...")
+            try:
+                self.page.locator(
+                    '.rpv-default-layout__toolbar button[aria-label="Download"], '
+                    '.rpv-toolbar__right > div:nth-child(4)'
+                ).first.wait_for(state='visible', timeout=15000)
+            except Exception as e:
+                self.logger.debug("Viewer toolbar did not appear within 15s: %s", e)
+
+            # Step 2: Debug-only viewer probe - each count() is a CDP
+            # round trip, so skip the whole block unless DEBUG is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                viewer_container = self.page.locator('.rpv-default-layout__container')
+                self.logger.debug("Viewer container count: %s", viewer_container.count())
+                self.logger.debug("Current page URL: %s", self.page.url)
+                for selector in ['.rpv-default-layout__toolbar', '.rpv-toolbar__right', 'button[aria-label="Download"]', '[data-testid="get-file__download-button"]']:
+                    count = self.page.locator(selector).count()
+                    self.logger.debug("Selector '%s' count: %s", selector, count)
+
+            # Step 3: Find and click the download button. Strategies in
+            # specificity order: full CSS path, class-based, aria-label.
+            # The selector that last worked goes first so the stable-DOM
+            # happy path is a single match instead of a fallback walk.
+            download_btn_selectors = [
+                '#content > div > div > div.col-md-9 > div > div:nth-child(2) > div > div > div > '
+                'div.rpv-default-layout__container > div > div.rpv-default-layout__body > '
+                'div.rpv-default-layout__toolbar > div > div.rpv-toolbar__right > div:nth-child(4)',
+                '.rpv-toolbar__right > div:nth-child(4)',
+                '.rpv-default-layout__toolbar button[aria-label="Download"]',
+            ]
 
-            # Step 3: Find and click the download button using multiple selector strategies
             with self.page.expect_download(timeout=30000) as download_info:
                 download_clicked = False
 
-                # Strategy 1: Full CSS selector path (most specific)
-                try:
-                    download_btn = self.page.locator(
-                        '#content > div > div > div.col-md-9 > div > div:nth-child(2) > div > div > div > '
-                        'div.rpv-default-layout__container > div > div.rpv-default-layout__body > '
-                        'div.rpv-default-layout__toolbar > div > div.rpv-toolbar__right > div:nth-child(4)'
-                    )
-                    if download_btn.count() > 0:
-                        self.logger.debug(f"Clicking download button (full selector)...")
-                        download_btn.first.click(force=True, timeout=5000)
-                        download_clicked = True
-                        self.logger.info(f"✓ Clicked download button for {doc_label}")
-                except Exception as e:
-                    self.logger.debug(f"Full CSS selector failed: {e}")
-
-                # Strategy 2: Class-based selector (more flexible)
-                if not download_clicked:
+                for selector in self._selector_order('pdf_download_btn', download_btn_selectors):
                     try:
-                        download_btn = self.page.locator('.rpv-toolbar__right > div:nth-child(4)')
+                        download_btn = self.page.locator(selector)
                         if download_btn.count() > 0:
-                            self.logger.debug(f"Clicking download button (class selector)...")
+                            self.logger.debug("Clicking download button (%s)...", selector)
                             download_btn.first.click(force=True, timeout=5000)
                             download_clicked = True
-                            self.logger.info(f"✓ Clicked download button (class selector) for {doc_label}")
-                    except Exception as e:
-                        self.logger.debug(f"Class selector failed: {e}")
-
-                # Strategy 3: Aria-label selector (most semantic)
-                if not download_clicked:
-                    try:
-                        download_btn = self.page.locator('.rpv-default-layout__toolbar button[aria-label="Download"]')
-                        if download_btn.count() > 0:
-                            self.logger.debug(f"Clicking download button (aria-label)...")
-                            download_btn.first.click(force=True, timeout=5000)
-                            download_clicked = True
-                            self.logger.info(f"✓ Clicked download button (aria-label) for {doc_label}")
+                            self._learned_selectors['pdf_download_btn'] = selector
+                            self.logger.info(f"✓ Clicked download button for {doc_label}")
+                            break
                     except Exception as e:
-                        self.logger.debug(f"Aria-label selector failed: {e}")
+                        self.logger.debug("Download selector %s failed: %s", selector, e)
 
                 if not download_clicked:
                     self.logger.error(f"Could not find download button for {doc_label}")
                     return False
 
-            # Step 4: Save the downloaded file
+            # Step 4: Save the downloaded file. The bytes are already on
+            # disk in Playwright's temp dir, so move them into place rather
+            # than copying them a second time with save_as
             download = download_info.value
-            download.save_as(filepath)
-            self.logger.info(f"📥 Downloaded: {filepath.name}")
+            try:
+                shutil.move(str(download.path()), str(filepath))
+            except Exception as move_error:
+                self.logger.debug("Move from temp failed (%s), copying instead", move_error)
+                download.save_as(filepath)
+            if self._register_downloaded_file(filepath):
+                self.logger.info(f"📥 Downloaded: {filepath.name}")
 
             # Step 5: Close the viewer popup/tab and return to original page
             try:
@@ -1207,7 +1925,7 @@ class MiamiDadeCourtMonitor:
                     self.page = pages[0]
                     self.logger.debug("Returned to main page")
             except Exception as e:
-                self.logger.debug(f"Error closing viewer page: {e}")
+                self.logger.debug("Error closing viewer page: %s", e)
 
             return True
 
@@ -1221,17 +1939,16 @@ class MiamiDadeCourtMonitor:
         Returns:
             Tuple of (new_documents_count, total_documents_count)
         """
-        import re
-
         new_documents_count = 0
         total_documents_count = 0
 
         try:
-            self.logger.debug(f"Checking for Extra Documents tab in {case_number}...")
+            self.logger.debug("Checking for Extra Documents tab in %s...", case_number)
 
-            # Look for "Extra Documents" tab/link
-            html = self.page.content()
-            if 'EXTRA DOCUMENTS' not in html.upper():
+            # Look for "Extra Documents" tab/link. The text probe runs
+            # inside the browser, so the common no-tab case costs one
+            # locator query instead of serializing the whole DOM
+            if self.page.locator(':text-matches("EXTRA DOCUMENTS", "i")').count() == 0:
                 self.logger.debug("No Extra Documents tab found")
                 return new_documents_count, total_documents_count
 
@@ -1244,17 +1961,18 @@ class MiamiDadeCourtMonitor:
             ]
 
             clicked = False
-            for selector in extra_docs_selectors:
+            for selector in self._selector_order('extra_docs_tab', extra_docs_selectors):
                 try:
-                    self.logger.debug(f"Trying Extra Documents selector: {selector}")
+                    self.logger.debug("Trying Extra Documents selector: %s", selector)
                     self.page.click(selector, timeout=3000)
                     self.logger.info(f"✓ Clicked Extra Documents tab using: {selector}")
                     self._take_screenshot(f"14-after-click-extra-documents-{case_number}")
                     clicked = True
+                    self._learned_selectors['extra_docs_tab'] = selector
                     time.sleep(1)
                     break
                 except Exception as e:
-                    self.logger.debug(f"Extra Documents selector {selector} failed: {e}")
+                    self.logger.debug("Extra Documents selector %s failed: %s", selector, e)
                     continue
 
             if not clicked:
@@ -1262,41 +1980,27 @@ class MiamiDadeCourtMonitor:
                 self._take_screenshot(f"14-extra-documents-not-clickable-{case_number}")
                 return new_documents_count, total_documents_count
 
-            # Parse the Extra Documents table
-            html = self.page.content()
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Find the Extra Documents table (has "document" column, NO "din" or "book" columns)
-            extra_docs_table = None
-            for table in soup.find_all('table'):
-                headers = table.find_all('th')
-                if headers and len(headers) >= 2:
-                    header_text = ' '.join([h.get_text() for h in headers]).lower()
-                    self.logger.debug(f"Found table with headers: {header_text}")
-
-                    if ('view' in header_text or 'image' in header_text) and \
-                       'document' in header_text and \
-                       'din' not in header_text and \
-                       'book' not in header_text:
-                        extra_docs_table = table
-                        self.logger.info(f"✓ Found Extra Documents table in {case_number}")
-                        break
+            # Pull the Extra Documents table (has a "document" column, NO
+            # "din" or "book" columns) in one pass - the :has()/:not()
+            # selector pushes the header filtering into the engine instead
+            # of looping every table's headers in Python
+            doc_rows = self._extract_table_rows(
+                'table:has(th:has-text("Document"))'
+                ':not(:has(th:has-text("Din"))):not(:has(th:has-text("Book")))',
+                ('document',), exclude_needles=('din', 'book'))
 
-            if not extra_docs_table:
+            if not doc_rows:
                 self.logger.debug("Could not find Extra Documents table")
                 return new_documents_count, total_documents_count
 
-            rows = extra_docs_table.find_all('tr')
-            self.logger.info(f"Found {len(rows)-1} row(s) in Extra Documents table")
+            self.logger.info(f"Found {len(doc_rows)} row(s) in Extra Documents table")
 
-            for row_index, row in enumerate(rows[1:], start=1):  # Skip header
-                cells = row.find_all('td')
+            for row_index, row_data in enumerate(doc_rows, start=1):
+                cells = row_data['cells']
                 if len(cells) >= 2:
                     try:
-                        # Check if first cell has a view/download button
-                        view_cell = cells[0]
-                        if not (view_cell.find('img') or view_cell.find('a') or view_cell.find('svg') or
-                                view_cell.find('span', {'role': 'button'})):
+                        # Skip rows whose first cell has no view/download button
+                        if not row_data['has_document']:
                             continue
 
                         # Count this document (whether new or already seen)
@@ -1305,12 +2009,11 @@ class MiamiDadeCourtMonitor:
                         # Get document description from the last column
                         doc_desc = ""
                         if len(cells) >= 3:
-                            doc_desc = cells[-1].get_text().strip()
+                            doc_desc = cells[-1]
 
                         # Fallback to searching all cells
                         if not doc_desc or len(doc_desc) < 3:
-                            for cell in cells[1:]:
-                                text = cell.get_text().strip()
+                            for text in cells[1:]:
                                 if text and len(text) > 3:
                                     doc_desc = text
                                     break
@@ -1323,138 +2026,116 @@ class MiamiDadeCourtMonitor:
 
                         # Check if already downloaded
                         if doc_id in self.seen_documents:
-                            self.logger.debug(f"Extra document already downloaded: {doc_id}")
+                            self.logger.debug("Extra document already downloaded: %s", doc_id)
                             continue
 
                         # This is a new document
                         new_documents_count += 1
 
-                        # Create case-specific subdirectory
-                        case_dir = self.documents_dir / case_number
-                        case_dir.mkdir(parents=True, exist_ok=True)
-
-                        # Generate safe filename (no need for case_number prefix since it's in folder)
-                        safe_desc = re.sub(r'[^\w\s-]', '', doc_desc)
-                        safe_desc = re.sub(r'[-\s]+', '-', safe_desc)
-                        safe_desc = safe_desc[:100]
-                        filename = f"{safe_desc}.pdf"
-                        filepath = case_dir / filename
-
-                        # Handle duplicate filenames
-                        counter = 1
-                        while filepath.exists():
-                            filename = f"{safe_desc}-{counter}.pdf"
-                            filepath = case_dir / filename
-                            counter += 1
+                        filename, filepath = self._document_filepath(case_number, doc_desc)
 
                         self.logger.info(f"Downloading extra document: {case_number}/{filename}")
 
                         # For Extra Documents, find and click view button by looking for SVG icon
                         # Extra Documents uses a different structure than Dockets
                         clicked_view = False
+                        downloaded_direct = False
                         viewer_page = None
-                        initial_pages = 0  # Will be set when button is found
                         current_url = ""   # Will be set when button is found
 
-                        self.logger.debug(f"Looking for Extra Doc view button for: {doc_desc}")
+                        self.logger.debug("Looking for Extra Doc view button for: %s", doc_desc)
 
                         # Use same approach as working Dockets code
                         # Find all table rows and look for the one containing our document description
                         desc_search = doc_desc[:30].strip()  # Use first 30 chars for matching
-                        self.logger.debug(f"Looking for row with description: {desc_search}")
+                        self.logger.debug("Looking for row with description: %s", desc_search)
 
-                        rows = self.page.locator('table tr')
+                        # Push the text filter into the browser instead of
+                        # shipping every row's text back over CDP
+                        rows = self.page.locator('table tr', has_text=desc_search)
                         view_btn_found = False
 
-                        for i in range(rows.count()):
-                            row = rows.nth(i)
-                            row_text = row.inner_text()
-
-                            # Check if this row contains the document description
-                            if desc_search in row_text:
-                                self.logger.debug(f"Found matching row for Extra Doc: {doc_desc}")
-
-                                # Look for view buttons - try multiple selector strategies
-                                # Extra Documents may use different aria-labels than Dockets
-                                view_button_selectors = [
-                                    'span[role="button"][aria-label*="View"]',
-                                    'span[role="button"]',
-                                    'button[aria-label*="View"]',
-                                    'button',
-                                    'a[href*="viewDocument"]',
-                                ]
+                        if rows.count() > 0:
+                            row = rows.first
+                            self.logger.debug("Found matching row for Extra Doc: %s", doc_desc)
+
+                            # Look for view buttons - try multiple selector strategies
+                            # Extra Documents may use different aria-labels than Dockets
+                            view_button_selectors = [
+                                'span[role="button"][aria-label*="View"]',
+                                'span[role="button"]',
+                                'button[aria-label*="View"]',
+                                'button',
+                                'a[href*="viewDocument"]',
+                            ]
+
+                            for selector in view_button_selectors:
+                                try:
+                                    view_buttons = row.locator(selector)
+                                    button_count = view_buttons.count()
 
-                                for selector in view_button_selectors:
-                                    try:
-                                        view_buttons = row.locator(selector)
-                                        button_count = view_buttons.count()
+                                    if button_count > 0:
+                                        self.logger.debug("Found %s buttons with selector '%s' in Extra Doc row", button_count, selector)
 
-                                        if button_count > 0:
-                                            self.logger.debug(f"Found {button_count} buttons with selector '{selector}' in Extra Doc row")
+                                        current_url = self.page.url
 
-                                            # Get current state before clicking
-                                            initial_pages = len(self.page.context.pages)
-                                            current_url = self.page.url
+                                        # Scroll the row into view
+                                        try:
+                                            row.scroll_into_view_if_needed()
+                                            time.sleep(0.5)
+                                        except:
+                                            pass
 
-                                            # Scroll the row into view
-                                            try:
-                                                row.scroll_into_view_if_needed()
-                                                time.sleep(0.5)
-                                            except:
-                                                pass
+                                        # Try to click the last button (usually desktop version)
+                                        try:
+                                            last_btn = view_buttons.last
+                                            last_btn.scroll_into_view_if_needed()
+                                            time.sleep(0.5)
 
-                                            # Try to click the last button (usually desktop version)
+                                            # Use dispatch_event like Dockets code (proven to
+                                            # work), resolving a popup on the event itself
+                                            self.logger.debug("Clicking Extra Doc view button with dispatch_event...")
                                             try:
-                                                last_btn = view_buttons.last
-                                                last_btn.scroll_into_view_if_needed()
-                                                time.sleep(0.5)
-
-                                                # Use dispatch_event like Dockets code (proven to work)
-                                                self.logger.debug(f"Clicking Extra Doc view button with dispatch_event...")
-                                                self.logger.debug(f"DEBUG: Before click - URL: {current_url}, Pages: {initial_pages}")
-                                                last_btn.dispatch_event('click', {'bubbles': True, 'cancelable': True})
+                                                with self.page.expect_popup(timeout=3000) as popup_info:
+                                                    last_btn.dispatch_event('click', {'bubbles': True, 'cancelable': True})
+                                                    clicked_view = True
+                                                    view_btn_found = True
+                                                viewer_page = popup_info.value
+                                                self.logger.debug("Extra Doc viewer popup opened: %s", viewer_page.url)
+                                            except Exception:
+                                                # No popup - viewer loads inline
                                                 clicked_view = True
                                                 view_btn_found = True
-                                                self.logger.info(f"✓ Clicked Extra Doc view button for: {doc_desc}")
-
-                                                # Wait for viewer to start loading
-                                                time.sleep(3)  # Longer wait for viewer initialization
-
-                                                # Debug: Check what happened after click
-                                                self.logger.debug(f"DEBUG: After click - URL: {self.page.url}, Pages: {len(self.page.context.pages)}")
-                                                self._take_screenshot(f"14z-after-extra-doc-click-{case_number}")
-                                                break
-                                            except Exception as click_error:
-                                                self.logger.debug(f"Click failed with selector '{selector}': {click_error}")
-                                                continue
-                                    except Exception as e:
-                                        self.logger.debug(f"Selector {selector} failed: {e}")
-                                        continue
-
-                                if view_btn_found:
-                                    break
+                                                try:
+                                                    self.page.locator('.rpv-default-layout__container, .rpv-core__viewer').wait_for(state='attached', timeout=15000)
+                                                except Exception:
+                                                    self.logger.debug("Viewer not attached after Extra Doc click")
+                                            self.logger.info(f"✓ Clicked Extra Doc view button for: {doc_desc}")
+
+                                            # Debug: Check what happened after click
+                                            self.logger.debug("DEBUG: After click - URL: %s, Pages: %s", self.page.url, len(self.page.context.pages))
+                                            self._take_screenshot(f"14z-after-extra-doc-click-{case_number}")
+                                            break
+                                        except Exception as click_error:
+                                            self.logger.debug("Click failed with selector '%s': %s", selector, click_error)
+                                            continue
+                                except Exception as e:
+                                    self.logger.debug("Selector %s failed: %s", selector, e)
+                                    continue
+
 
                         if not view_btn_found:
                             self.logger.warning(f"Could not find/click view button for: {doc_desc}")
                             continue
 
-                        # Wait additional time for viewer to load
-                        time.sleep(2)
-
                         # Track if we navigated inline (same page, different URL)
                         navigated_inline = False
                         viewer_loaded = False
-                        
-                        # Check if new page opened
-                        current_pages = self.page.context.pages
-                        if len(current_pages) > initial_pages:
-                            # New page/popup opened
-                            viewer_page = current_pages[-1]
+
+                        if viewer_page is not None:
+                            # Popup already resolved by expect_popup
                             self.page = viewer_page
                             self.logger.info(f"✓ Opened viewer in new page for {doc_desc}")
-                            # Wait a bit more for viewer to initialize
-                            time.sleep(2)
-                            # Assume viewer is available when new page opens
                             viewer_loaded = True
                             self._take_screenshot(f"14a-after-extra-documents-viewer-loaded-{case_number}")
                         elif self.page.url != current_url:
@@ -1468,7 +2149,6 @@ class MiamiDadeCourtMonitor:
                                     state='attached', timeout=15000
                                 )
                                 self.logger.info(f"✓ React PDF Viewer loaded inline for {doc_desc}")
-                                time.sleep(2)  # Additional wait for full render
                                 viewer_loaded = True
                                 self._take_screenshot(f"14b-after-extra-documents-viewer-loaded-{case_number}")
                             except Exception as e:
@@ -1487,8 +2167,6 @@ class MiamiDadeCourtMonitor:
                                     state='attached', timeout=15000
                                 )
                                 self.logger.info(f"✓ React PDF Viewer loaded inline for {doc_desc}")
-                                # Wait an additional moment for full render
-                                time.sleep(2)
                                 viewer_loaded = True
                                 self._take_screenshot(f"14c-after-extra-documents-viewer-loaded-{case_number}")
                             except Exception as e:
@@ -1498,12 +2176,11 @@ class MiamiDadeCourtMonitor:
                                 # Try to extract PDF URL from page source as fallback (like Dockets code)
                                 try:
                                     self.logger.debug("Attempting to find PDF URL directly in page source...")
-                                    pdf_url_pattern = r'(https?://[^\s<>"]+\.pdf[^\s<>"]*|/cjis/[^\s<>"]*viewDocument[^\s<>"]*)'
                                     page_content = self.page.content()
-                                    import re as re_module
-                                    pdf_urls = re_module.findall(pdf_url_pattern, page_content)
+                                    pdf_urls = _VIEW_DOC_URL_RE.findall(page_content)
                                     if pdf_urls:
-                                        self.logger.debug(f"Found potential PDF URLs: {pdf_urls[:3]}")
+                                        self.logger.debug("Found potential PDF URLs: %s", pdf_urls[:3])
+                                        downloaded_direct = self._download_pdf_direct(pdf_urls[0], filepath)
                                 except:
                                     pass
 
@@ -1512,7 +2189,9 @@ class MiamiDadeCourtMonitor:
                         # Use the consolidated React PDF Viewer download helper only if viewer loaded
                         # viewer_page is set when a new page opened, navigated_inline is True when URL changed,
                         # and viewer_loaded is True when viewer container appeared
-                        if viewer_page is not None or (navigated_inline and viewer_loaded) or viewer_loaded:
+                        if downloaded_direct:
+                            download_success = True
+                        elif viewer_page is not None or (navigated_inline and viewer_loaded) or viewer_loaded:
                             download_success = self._handle_react_pdf_viewer_download(filepath, viewer_page, doc_desc)
                         else:
                             download_success = False
@@ -1521,6 +2200,7 @@ class MiamiDadeCourtMonitor:
                         if download_success:
                             # Success!
                             self.seen_documents.add(doc_id)
+                            self._note_seen('document', doc_id)
                             self.logger.info(f"✓ Downloaded extra document: {case_number}/{filename}")
                         else:
                             self.logger.warning(f"Failed to download extra document: {doc_desc}")
@@ -1532,11 +2212,10 @@ class MiamiDadeCourtMonitor:
                                 self.logger.debug("Navigating back (inline navigation detected)")
                                 try:
                                     self.page.go_back()
-                                    time.sleep(2)
-                                    # Wait for page to load after going back
-                                    self.page.wait_for_load_state('networkidle', timeout=5000)
+                                    # Bounded wait instead of a fixed pad
+                                    self.page.wait_for_load_state('domcontentloaded', timeout=5000)
                                 except Exception as back_error:
-                                    self.logger.debug(f"Browser back failed: {back_error}")
+                                    self.logger.debug("Browser back failed: %s", back_error)
                             
                             # Try to re-click Extra Documents tab
                             # First check if we're on the right page
@@ -1545,7 +2224,7 @@ class MiamiDadeCourtMonitor:
                                 # Still on viewer page - go back
                                 try:
                                     self.page.go_back()
-                                    time.sleep(2)
+                                    self.page.wait_for_load_state('domcontentloaded', timeout=5000)
                                 except:
                                     pass
                             
@@ -1561,23 +2240,23 @@ class MiamiDadeCourtMonitor:
                                         extra_docs_clicked = True
                                         break
                                 except Exception as e:
-                                    self.logger.debug(f"Failed to re-click Extra Documents with {selector}: {e}")
+                                    self.logger.debug("Failed to re-click Extra Documents with %s: %s", selector, e)
                                     continue
                             
                             if not extra_docs_clicked:
                                 self.logger.debug("Could not re-click Extra Documents tab - may need to re-navigate to case")
                         except Exception as nav_error:
-                            self.logger.debug(f"Error navigating back to Extra Documents: {nav_error}")
+                            self.logger.debug("Error navigating back to Extra Documents: %s", nav_error)
 
-                        # Small delay between downloads
-                        time.sleep(0.5)
+                        self._download_failures = 0
 
                     except Exception as e:
-                        self.logger.debug(f"Error downloading extra document from row {row_index}: {e}")
+                        self.logger.debug("Error downloading extra document from row %s: %s", row_index, e)
+                        self._download_backoff()
                         continue
 
         except Exception as e:
-            self.logger.debug(f"Error checking Extra Documents tab: {e}")
+            self.logger.debug("Error checking Extra Documents tab: %s", e)
 
         return new_documents_count, total_documents_count
 
@@ -1711,7 +2390,7 @@ class MiamiDadeCourtMonitor:
                         cob_selected = True
                         break
                     except Exception as e:
-                        self.logger.debug(f"Country selector {selector} failed: {e}")
+                        self.logger.debug("Country selector %s failed: %s", selector, e)
                         continue
 
                 if not cob_selected:
@@ -1779,7 +2458,7 @@ class MiamiDadeCourtMonitor:
                     time.sleep(0.5)
                     driver.execute_script("arguments[0].click();", btn)
                     search_clicked = True
-                    self.logger.debug(f"Clicked search using: {selector}")
+                    self.logger.debug("Clicked search using: %s", selector)
                     break
                 except Exception:
                     continue
@@ -1798,7 +2477,7 @@ class MiamiDadeCourtMonitor:
 
             # Parse results
             html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, _SOUP_PARSER)
             page_text = soup.get_text().lower()
 
             # Check for internal error (reCAPTCHA failure)
@@ -1874,7 +2553,7 @@ class MiamiDadeCourtMonitor:
                         driver.save_screenshot(str(self.screenshots_dir / "ice_04_retry_results.png"))
 
                     html = driver.page_source
-                    soup = BeautifulSoup(html, 'html.parser')
+                    soup = BeautifulSoup(html, _SOUP_PARSER)
                     page_text = soup.get_text().lower()
                     if 'internal error' in page_text:
                         self.logger.error("ICE locator: Internal Error persists after retry")
@@ -1892,8 +2571,8 @@ class MiamiDadeCourtMonitor:
 
         except Exception as e:
             self.logger.error(f"Error checking ICE detainee locator: {e}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Traceback:", exc_info=True)
             if self.enable_screenshots and driver:
                 try:
                     driver.save_screenshot(str(self.screenshots_dir / "ice_error_exception.png"))
@@ -1937,7 +2616,7 @@ class MiamiDadeCourtMonitor:
         lines = [l.strip() for l in body_text.split('\n') if l.strip()]
 
         # Debug: log the lines around the name for selector tuning
-        self.logger.debug(f"ICE results page lines: {lines}")
+        self.logger.debug("ICE results page lines: %s", lines)
 
         # Find the name line and extract fields from surrounding lines
         full_name = ""
@@ -2022,7 +2701,7 @@ class MiamiDadeCourtMonitor:
             return
 
         # Build SMS message
-        message_parts = [f"🚨 ICE Alert: {self.defendant_first_name} {self.defendant_last_name}"]
+        message_parts = [f"🚨 ICE Alert: {self.display_name}"]
         for change in changes:
             message_parts.append(f"  • {change}")
         if current_status:
@@ -2031,95 +2710,48 @@ class MiamiDadeCourtMonitor:
             message_parts.append(f"Facility: {current_status.detention_facility}")
         message = "\n".join(message_parts)
 
-        # Send SMS via Twilio
-        if self.notification_sms:
-            try:
-                from twilio.rest import Client
-                if all([self.twilio_account_sid, self.twilio_auth_token, self.twilio_phone_number]):
-                    client = Client(self.twilio_account_sid, self.twilio_auth_token)
-                    sms_message = client.messages.create(
-                        body=message,
-                        from_=self.twilio_phone_number,
-                        to=self.notification_sms
-                    )
-                    self.logger.info(f"📱 ICE SMS sent to {self.notification_sms} (SID: {sms_message.sid})")
-            except Exception as e:
-                self.logger.error(f"❌ Error sending ICE SMS: {e}")
-
-        # Send Email
-        if self.notification_email:
-            try:
-                import smtplib
-                from email.mime.text import MIMEText
-                from email.mime.multipart import MIMEMultipart
-
-                if all([self.smtp_server, self.smtp_username, self.smtp_password]):
-                    msg = MIMEMultipart('alternative')
-                    msg['Subject'] = f"🚨 ICE Alert: {self.defendant_first_name} {self.defendant_last_name}"
-                    msg['From'] = self.smtp_from_address
-                    msg['To'] = self.notification_email
-
-                    text_body = message
-
-                    html_body = f"""
-                    <html>
-                      <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                        <div style="background-color: #e65100; color: white; padding: 15px; border-radius: 5px 5px 0 0;">
-                          <h2 style="margin: 0;">🚨 ICE Detainee Alert</h2>
-                          <p style="margin: 5px 0 0 0; font-size: 16px;">{self.defendant_first_name} {self.defendant_last_name}</p>
-                        </div>
-                        <div style="padding: 20px; background-color: #f5f5f5; border-radius: 0 0 5px 5px;">
-                          <div style="background-color: white; padding: 15px; margin-bottom: 15px; border-radius: 5px; border-left: 4px solid #e65100;">
-                            <h3 style="margin: 0 0 10px 0; color: #e65100;">Changes Detected</h3>
-                            <ul style="margin: 5px 0; padding-left: 20px;">
-                    """
-                    for change in changes:
-                        html_body += f"<li><strong>{change}</strong></li>"
-
-                    html_body += """
-                            </ul>
-                          </div>
-                    """
-
-                    if current_status:
-                        html_body += f"""
-                          <div style="background-color: white; padding: 15px; border-radius: 5px; border-left: 4px solid #2196f3;">
-                            <h3 style="margin: 0 0 10px 0; color: #2196f3;">Current Status</h3>
-                            <table style="width: 100%; border-collapse: collapse;">
-                              <tr><td style="padding: 8px; font-weight: bold;">Name</td><td style="padding: 8px;">{current_status.full_name}</td></tr>
-                              <tr><td style="padding: 8px; font-weight: bold;">Status</td><td style="padding: 8px;">{current_status.status}</td></tr>
-                              <tr><td style="padding: 8px; font-weight: bold;">State</td><td style="padding: 8px;">{current_status.state}</td></tr>
-                              <tr><td style="padding: 8px; font-weight: bold;">Facility</td><td style="padding: 8px;">{current_status.detention_facility}</td></tr>
-                              <tr><td style="padding: 8px; font-weight: bold;">Country of Birth</td><td style="padding: 8px;">{current_status.country_of_birth}</td></tr>
-                              <tr><td style="padding: 8px; font-weight: bold;">First Seen</td><td style="padding: 8px;">{current_status.first_seen}</td></tr>
-                              <tr><td style="padding: 8px; font-weight: bold;">Last Checked</td><td style="padding: 8px;">{current_status.last_checked}</td></tr>
-                            </table>
-                          </div>
-                        """
-
-                    html_body += """
-                        </div>
-                        <div style="text-align: center; padding: 15px; color: #999; font-size: 12px;">
-                          <p>ICE Detainee Locator Monitor</p>
-                        </div>
-                      </body>
-                    </html>
-                    """
-
-                    part1 = MIMEText(text_body, 'plain')
-                    part2 = MIMEText(html_body, 'html')
-                    msg.attach(part1)
-                    msg.attach(part2)
+        if not self.notification_sms and not self.notification_email:
+            return
 
-                    recipients = [email.strip() for email in self.notification_email.split(',')]
-                    with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                        server.starttls()
-                        server.login(self.smtp_username, self.smtp_password)
-                        server.sendmail(self.smtp_from_address, recipients, msg.as_string())
+        # Build HTML body once, then fan out to whichever channels are set
+        subject = f"🚨 ICE Alert: {self.display_name}"
+        if not self._email_wants_html:
+            self._dispatch_notifications(subject, message, '')
+            return
+        html_parts = [self.EMAIL_HTML_HEADER.format(
+            banner_color='#e65100', title='🚨 ICE Detainee Alert',
+            defendant=f"{self.display_name}")]
+        html_parts.append("""
+              <div style="background-color: white; padding: 15px; margin-bottom: 15px; border-radius: 5px; border-left: 4px solid #e65100;">
+                <h3 style="margin: 0 0 10px 0; color: #e65100;">Changes Detected</h3>
+                <ul style="margin: 5px 0; padding-left: 20px;">
+        """)
+        for change in changes:
+            html_parts.append(f"<li><strong>{change}</strong></li>")
+        html_parts.append("""
+                </ul>
+              </div>
+        """)
 
-                    self.logger.info(f"📧 ICE email sent to {', '.join(recipients)}")
-            except Exception as e:
-                self.logger.error(f"❌ Error sending ICE email: {e}")
+        if current_status:
+            html_parts.append(f"""
+              <div style="background-color: white; padding: 15px; border-radius: 5px; border-left: 4px solid #2196f3;">
+                <h3 style="margin: 0 0 10px 0; color: #2196f3;">Current Status</h3>
+                <table style="width: 100%; border-collapse: collapse;">
+                  <tr><td style="padding: 8px; font-weight: bold;">Name</td><td style="padding: 8px;">{current_status.full_name}</td></tr>
+                  <tr><td style="padding: 8px; font-weight: bold;">Status</td><td style="padding: 8px;">{current_status.status}</td></tr>
+                  <tr><td style="padding: 8px; font-weight: bold;">State</td><td style="padding: 8px;">{current_status.state}</td></tr>
+                  <tr><td style="padding: 8px; font-weight: bold;">Facility</td><td style="padding: 8px;">{current_status.detention_facility}</td></tr>
+                  <tr><td style="padding: 8px; font-weight: bold;">Country of Birth</td><td style="padding: 8px;">{current_status.country_of_birth}</td></tr>
+                  <tr><td style="padding: 8px; font-weight: bold;">First Seen</td><td style="padding: 8px;">{current_status.first_seen}</td></tr>
+                  <tr><td style="padding: 8px; font-weight: bold;">Last Checked</td><td style="padding: 8px;">{current_status.last_checked}</td></tr>
+                </table>
+              </div>
+            """)
+
+        html_parts.append(self.EMAIL_HTML_FOOTER.format(footer='ICE Detainee Locator Monitor'))
+
+        self._dispatch_notifications(subject, message, "".join(html_parts))
 
     def check_all_cases(self) -> Dict[str, any]:
         """
@@ -2137,6 +2769,8 @@ class MiamiDadeCourtMonitor:
             'total_documents': 0,
             'new_charges': [],
             'new_dockets': [],
+            'new_charges_by_case': {},
+            'new_dockets_by_case': {},
             'new_documents_count': 0,
             'total_documents_seen': 0,
             'case_summaries': [],
@@ -2154,7 +2788,7 @@ class MiamiDadeCourtMonitor:
                 cases = [c for c in cases if c['case_number'] == self.filter_case_number]
 
                 if not cases:
-                    self.logger.warning(f"Case {self.filter_case_number} not found for {self.defendant_first_name} {self.defendant_last_name}")
+                    self.logger.warning(f"Case {self.filter_case_number} not found for {self.display_name}")
                     return results
 
                 self.logger.info(f"Found matching case: {self.filter_case_number}")
@@ -2163,130 +2797,11 @@ class MiamiDadeCourtMonitor:
 
             self.logger.info(f"Found {len(cases)} case(s) to monitor")
 
-            # Process each case
-            for case_index, case_data in enumerate(cases):
-                case_number = case_data['case_number']
-                case_url = case_data['case_url']
-
-                self.logger.info(f"Checking case: {case_number} ({case_index + 1}/{len(cases)})")
-
-                # If this is not the first case, re-perform the search to get back to case list
-                # This is more reliable than trying to navigate back
-                if case_index > 0:
-                    self.logger.info("Re-performing search to access case list...")
-                    self._take_screenshot(f"15-re-performing-search-case-{case_index}")
-
-                    # Perform the full defendant search
-                    if not self._perform_defendant_search():
-                        self.logger.error("Failed to re-perform defendant search")
-                        continue
-
-                    # Click on defendant result to open case list popup
-                    defendant_name = f"{self.defendant_last_name.upper()}, {self.defendant_first_name.upper()}"
-                    defendant_selectors = [
-                        f'text={defendant_name}',
-                        f':text("{self.defendant_last_name}")',
-                        '[class*="defendant"]',
-                        f'div:has-text("{self.defendant_last_name.upper()}")'
-                    ]
-
-                    clicked_defendant = False
-                    for selector in defendant_selectors:
-                        try:
-                            self.logger.debug(f"Trying to click defendant with: {selector}")
-                            self.page.click(selector, timeout=5000)
-                            self.logger.info(f"✓ Opened case list using: {selector}")
-                            self._take_screenshot(f"16-after-reclick-defendant-case-{case_index}")
-                            clicked_defendant = True
-                            time.sleep(2)
-                            break
-                        except Exception as click_err:
-                            self.logger.debug(f"Selector {selector} failed: {click_err}")
-                            continue
-
-                    if not clicked_defendant:
-                        self.logger.error("Could not open case list")
-                        self._take_screenshot(f"16-error-reclick-defendant-case-{case_index}")
-                        continue
-
-                    # Verify the case list is visible
-                    html = self.page.content()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    table = soup.find('table')
-                    if table:
-                        self.logger.debug("✓ Case list table is now visible")
-                    else:
-                        self.logger.warning("Case list table NOT visible!")
-                        continue
-
-                # Fetch charges and docket entries
-                charges, docket_entries, new_documents_this_case, total_documents_this_case = self._fetch_case_details(case_url, case_number)
-
-                # Update case info
-                self.case_info[case_number] = CaseInfo(
-                    case_number=case_number,
-                    filed_date=case_data['filed_date'],
-                    closed_date=case_data['closed_date'],
-                    first_charge=case_data['first_charge'],
-                    balance_due=case_data['balance_due'],
-                    charge_count=len(charges),
-                    docket_count=len(docket_entries),
-                    last_checked=datetime.now().isoformat()
-                )
-
-                results['total_charges'] += len(charges)
-                results['total_dockets'] += len(docket_entries)
-                results['new_documents_count'] += new_documents_this_case
-                results['total_documents_seen'] += total_documents_this_case
-
-                # Check for new charges
-                new_charges_this_case = []
-                for charge in charges:
-                    charge_hash = self._generate_charge_hash(
-                        charge.case_number,
-                        charge.sequence_number,
-                        charge.charge_description,
-                        charge.charge_type
-                    )
-
-                    if charge_hash not in self.seen_charges:
-                        new_charges_this_case.append(charge)
-                        results['new_charges'].append(charge)
-                        self.seen_charges.add(charge_hash)
-                        self.logger.info(f"  🆕 NEW CHARGE: Seq {charge.sequence_number} - {charge.charge_description}")
-
-                # Check for new dockets
-                new_dockets_this_case = []
-                for docket in docket_entries:
-                    docket_hash = self._generate_docket_hash(
-                        docket.case_number,
-                        docket.din,
-                        docket.date,
-                        docket.docket_description
-                    )
-
-                    if docket_hash not in self.seen_dockets:
-                        new_dockets_this_case.append(docket)
-                        results['new_dockets'].append(docket)
-                        self.seen_dockets.add(docket_hash)
-                        self.logger.info(f"  🆕 NEW DOCKET: Din {docket.din} - {docket.docket_description[:50]}")
-
-                # Add case summary
-                results['case_summaries'].append({
-                    'case_number': case_number,
-                    'charge_count': len(charges),
-                    'docket_count': len(docket_entries),
-                    'documents_count': new_documents_this_case,
-                    'new_charges_count': len(new_charges_this_case),
-                    'new_dockets_count': len(new_dockets_this_case),
-                    'new_documents_count': new_documents_this_case,
-                    'first_charge': case_data['first_charge']
-                })
+            if self.parallel_cases > 1 and len(cases) > 1:
+                self._check_cases_parallel(cases, results)
+            else:
+                self._check_cases_sequential(cases, results)
 
-                # Be polite - delay between cases
-                if case_index < len(cases) - 1:
-                    time.sleep(1)
-            
             # Save state
             self._save_state()
 
@@ -2301,38 +2816,401 @@ class MiamiDadeCourtMonitor:
                         self.ice_status = None
                     results['ice_changes'] = ice_changes
                     results['ice_status'] = self.ice_status
-                    self._save_state()
+                    # ICE status lives only in snapshots, so force one on change
+                    self._save_state(force=bool(ice_changes))
                 except Exception as ice_err:
                     self.logger.error(f"Error during ICE check: {ice_err}")
-                    import traceback
-                    self.logger.debug(traceback.format_exc())
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Traceback:", exc_info=True)
 
         except Exception as e:
             self.logger.error(f"Error checking cases: {e}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Traceback:", exc_info=True)
 
         return results
-    
-    def _send_notification(self, new_charges: List[Charge], new_dockets: List[DocketEntry]):
+
+    def _case_unchanged(self, case_data: Dict[str, str]) -> bool:
         """
-        Send notifications about new charges and dockets via SMS and/or email
+        Cheap HEAD-request check for whether a case scrape can be skipped
+
+        Only trusts validators the server explicitly provides (ETag /
+        Last-Modified) and only when a previous full scrape recorded them -
+        the case pages are client-rendered, so a byte-identical app shell
+        is no proof that the case data behind it is unchanged. A full
+        re-scrape is forced after HEAD_SKIP_MAX consecutive skips as a
+        safety net against servers that return a constant validator.
+        """
+        case_number = case_data['case_number']
+        case_url = case_data['case_url']
+        info = self.case_info.get(case_number)
+        if not case_url or info is None:
+            return False
 
-        Configuration in JSON file for Twilio SMS:
-        - twilio_account_sid: Your Twilio Account SID
-        - twilio_auth_token: Your Twilio Auth Token
-        - twilio_phone_number: Your Twilio phone number (e.g., +12345678900)
+        try:
+            r = self.http.head(case_url, timeout=10, allow_redirects=True)
+            etag = r.headers.get('ETag', '')
+            last_modified = r.headers.get('Last-Modified', '')
+        except Exception as e:
+            self.logger.debug("HEAD check failed for %s: %s", case_number, e)
+            return False
 
-        Configuration in JSON file for Email:
-        - smtp_server: SMTP server (e.g., smtp.gmail.com)
-        - smtp_port: SMTP port (default: 587)
-        - smtp_username: Your email username
-        - smtp_password: Your email password or app password
-        - smtp_from_address: From address (optional, defaults to smtp_username)
+        # Stash the fresh validators for _record_case_results to persist
+        case_data['etag'] = etag
+        case_data['last_modified'] = last_modified
+
+        if not etag and not last_modified:
+            return False
+        if etag != info.last_etag or last_modified != info.last_modified:
+            return False
+
+        streak = self._head_skip_streak.get(case_number, 0) + 1
+        if streak > self.HEAD_SKIP_MAX:
+            return False
+        self._head_skip_streak[case_number] = streak
+        return True
+
+    def _record_skipped_case(self, results: Dict, case_data: Dict[str, str]):
+        """Fold a HEAD-validated unchanged case into results from cache"""
+        case_number = case_data['case_number']
+        info = self.case_info[case_number]
+        info.last_checked = int(time.time())
+
+        results['total_charges'] += info.charge_count
+        results['total_dockets'] += info.docket_count
+        results['case_summaries'].append({
+            'case_number': case_number,
+            'charge_count': info.charge_count,
+            'docket_count': info.docket_count,
+            'documents_count': 0,
+            'new_charges_count': 0,
+            'new_dockets_count': 0,
+            'new_documents_count': 0,
+            'first_charge': case_data['first_charge']
+        })
+
+    def _check_cases_sequential(self, cases: List[Dict[str, str]], results: Dict):
+        """Process each case one at a time on the shared page"""
+        for case_index, case_data in enumerate(cases):
+            case_number = case_data['case_number']
+            case_url = case_data['case_url']
+
+            self.logger.info(f"Checking case: {case_number} ({case_index + 1}/{len(cases)})")
+
+            # Skip the whole click/expand/parse pipeline when the server
+            # vouches that the page is unchanged since the last scrape
+            if self._case_unchanged(case_data):
+                self.logger.info(f"⏭️  Case {case_number} unchanged (HEAD validators) - skipping scrape")
+                self._record_skipped_case(results, case_data)
+                continue
+
+            # No re-search between cases: _fetch_case_details navigates to
+            # case_url directly and only falls back to clicking the case
+            # list when no URL is known
+
+            # Fetch charges and docket entries
+            charges, docket_entries, new_documents_this_case, total_documents_this_case = self._fetch_case_details(case_url, case_number)
+
+            self._record_case_results(results, case_data, charges, docket_entries,
+                                      new_documents_this_case, total_documents_this_case)
+
+    def _check_cases_parallel(self, cases: List[Dict[str, str]], results: Dict):
         """
-        # Build notification message
+        Process cases concurrently, each in its own worker browser
+
+        The sync Playwright API is bound to the thread that started it, so
+        each worker thread runs an isolated Playwright instance rather than
+        sharing pages from one browser. Results are merged on the main
+        thread so the seen_* bookkeeping stays single-threaded.
+        """
+        # HEAD-validate up front so unchanged cases never spawn a worker
+        pending = []
+        for case_data in cases:
+            if self._case_unchanged(case_data):
+                self.logger.info(f"⏭️  Case {case_data['case_number']} unchanged (HEAD validators) - skipping scrape")
+                self._record_skipped_case(results, case_data)
+            else:
+                pending.append(case_data)
+        if not pending:
+            return
+
+        max_workers = min(self.parallel_cases, len(pending))
+        self.logger.info(f"Checking {len(pending)} cases with {max_workers} parallel workers...")
+
+        # Round-robin the pending cases across the workers so each worker
+        # thread launches its browser once and reuses it for its whole
+        # chunk, instead of paying the launch cost per case
+        chunks = [pending[i::max_workers] for i in range(max_workers)]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._fetch_cases_in_worker, chunk): chunk
+                       for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    outcomes = future.result()
+                except Exception as worker_err:
+                    failed = ', '.join(c['case_number'] for c in chunk)
+                    self.logger.error(f"Case worker failed ({failed}): {worker_err}")
+                    continue
+                for case_data, case_result, case_err in outcomes:
+                    if case_err is not None:
+                        self.logger.error(f"Error checking case {case_data['case_number']}: {case_err}")
+                        continue
+                    charges, dockets, new_docs, total_docs = case_result
+                    self._record_case_results(results, case_data, charges, dockets,
+                                              new_docs, total_docs)
+
+    def _make_case_worker(self) -> 'MiamiDadeCourtMonitor':
+        """Create a stateless monitor clone for a parallel case worker thread"""
+        worker = MiamiDadeCourtMonitor(
+            defendant_first_name=self.defendant_first_name,
+            defendant_last_name=self.defendant_last_name,
+            defendant_sex=self.defendant_sex,
+            data_file=str(self.data_file),
+            headless=self.headless,
+            skip_state=True,
+            download_documents=self.download_documents,
+            documents_dir=str(self.documents_dir),
+            download_concurrency=self.download_concurrency,
+            # Screenshot filenames are numbered per page flow, so keep
+            # debug screenshots to the main (sequential) path only
+            enable_screenshots=False
+        )
+        # Share the parent's sets so document dedup - both by id and by
+        # content hash - stays global (set.add is atomic under the GIL)
+        worker.seen_documents = self.seen_documents
+        worker.seen_document_hashes = self.seen_document_hashes
+        # Workers are built with skip_state=True, which would make their
+        # own _note_seen a no-op; journal through the parent instead so
+        # ids and hashes seen in parallel mode stay crash-durable
+        worker._note_seen = self._note_seen
+        # One politeness clock and one signature cache across all workers
+        worker._nav_state = self._nav_state
+        worker._case_page_sig = self._case_page_sig
+        return worker
+
+    def _fetch_cases_in_worker(self, cases_chunk: List[Dict[str, str]]) -> List[tuple]:
+        """
+        Worker entry point: scrape a chunk of cases in one reused browser
+
+        The sync Playwright API is bound to its starting thread, so a
+        browser context pool cannot be shared across workers; the closest
+        equivalent is one browser per worker thread, kept alive for the
+        whole chunk so the launch cost is paid once rather than per case.
+
+        Returns:
+            List of (case_data, result_tuple, error) - exactly one of
+            result_tuple/error is set per case
+        """
+        worker = self._make_case_worker()
+        outcomes = []
+        try:
+            worker._init_browser()
+            session_ready = False
+            for case_data in cases_chunk:
+                case_number = case_data['case_number']
+                try:
+                    # Cases are reached by direct case_url navigation; the
+                    # defendant search runs once per worker session just to
+                    # establish the site's cookies
+                    if not session_ready:
+                        if not worker._open_case_list():
+                            raise RuntimeError(f"Could not open case list for {case_number}")
+                        session_ready = True
+                    result = worker._fetch_case_details(case_data['case_url'], case_number)
+                    outcomes.append((case_data, result, None))
+                except Exception as case_err:
+                    outcomes.append((case_data, None, case_err))
+                    # A failed case can leave the page mid-flow; give the
+                    # next case a clean context in the same browser
+                    try:
+                        worker._new_context()
+                        session_ready = False
+                    except Exception as ctx_err:
+                        self.logger.debug("Worker context reset failed: %s", ctx_err)
+        finally:
+            worker._close_browser()
+        return outcomes
+
+    def _record_case_results(self, results: Dict, case_data: Dict[str, str],
+                             charges: List[Charge], docket_entries: List[DocketEntry],
+                             new_documents_this_case: int, total_documents_this_case: int):
+        """Merge one case's scrape results into the cycle results and seen-state"""
+        case_number = case_data['case_number']
+
+        # Update case info
+        self.case_info[case_number] = CaseInfo(
+            case_number=case_number,
+            filed_date=case_data['filed_date'],
+            closed_date=case_data['closed_date'],
+            first_charge=case_data['first_charge'],
+            balance_due=case_data['balance_due'],
+            charge_count=len(charges),
+            docket_count=len(docket_entries),
+            last_checked=int(time.time()),
+            last_etag=case_data.get('etag', ''),
+            last_modified=case_data.get('last_modified', '')
+        )
+        self._head_skip_streak[case_number] = 0
+
+        results['total_charges'] += len(charges)
+        results['total_dockets'] += len(docket_entries)
+        results['new_documents_count'] += new_documents_this_case
+        results['total_documents_seen'] += total_documents_this_case
+
+        # Check for new charges - hash every row up front, collect the
+        # fresh hashes locally, and fold them into the seen set with one
+        # C-level set.update instead of a per-row .add
+        charge_pairs = [
+            (charge, self._generate_charge_hash(
+                charge.case_number,
+                charge.sequence_number,
+                charge.charge_description,
+                charge.charge_type
+            ))
+            for charge in charges
+        ]
+        # One C-level set difference against the (large) seen set; the loop
+        # below only consults the small per-case remainder
+        fresh_charge_hashes = {h for _, h in charge_pairs} - self.seen_charges
+        new_charges_this_case = []
+        pending = set(fresh_charge_hashes)
+        for charge, charge_hash in charge_pairs:
+            if charge_hash in pending:
+                pending.discard(charge_hash)
+                new_charges_this_case.append(charge)
+                results['new_charges'].append(charge)
+                self._note_seen('charge', charge_hash)
+                self.logger.info(f"  🆕 NEW CHARGE: Seq {charge.sequence_number} - {charge.charge_description}")
+        self.seen_charges.update(fresh_charge_hashes)
+        if new_charges_this_case:
+            # Group per case here, once - the console and email renderers
+            # both consume this instead of regrouping the flat list
+            results['new_charges_by_case'].setdefault(case_number, []).extend(new_charges_this_case)
+
+        # Check for new dockets - same batched pattern
+        docket_pairs = [
+            (docket, self._generate_docket_hash(
+                docket.case_number,
+                docket.din,
+                docket.date,
+                docket.docket_description
+            ))
+            for docket in docket_entries
+        ]
+        fresh_docket_hashes = {h for _, h in docket_pairs} - self.seen_dockets
+        new_dockets_this_case = []
+        pending = set(fresh_docket_hashes)
+        for docket, docket_hash in docket_pairs:
+            if docket_hash in pending:
+                pending.discard(docket_hash)
+                new_dockets_this_case.append(docket)
+                results['new_dockets'].append(docket)
+                self._note_seen('docket', docket_hash)
+                self.logger.info(f"  🆕 NEW DOCKET: Din {docket.din} - {docket.docket_description[:50]}")
+        self.seen_dockets.update(fresh_docket_hashes)
+        if new_dockets_this_case:
+            results['new_dockets_by_case'].setdefault(case_number, []).extend(new_dockets_this_case)
+
+        # Add case summary
+        results['case_summaries'].append({
+            'case_number': case_number,
+            'charge_count': len(charges),
+            'docket_count': len(docket_entries),
+            'documents_count': new_documents_this_case,
+            'new_charges_count': len(new_charges_this_case),
+            'new_dockets_count': len(new_dockets_this_case),
+            'new_documents_count': new_documents_this_case,
+            'first_charge': case_data['first_charge']
+        })
+
+    def _get_twilio_client(self):
+        """Return the cached Twilio client, creating it on first use"""
+        if self._twilio_client is None:
+            from twilio.rest import Client
+            self._twilio_client = Client(self.twilio_account_sid, self.twilio_auth_token)
+        return self._twilio_client
+
+    SMTP_CONNECT_TIMEOUT = 15
+
+    def _smtp_connect(self):
+        """
+        Open, secure, and authenticate a fresh SMTP session
+
+        Called lazily from _smtp_send, so idle cycles with nothing to
+        notify never pay for DNS resolution or the TCP/TLS connect. The
+        explicit timeout bounds a hung connect instead of blocking the
+        poll loop indefinitely. The hostname (not a cached IP) is passed
+        so starttls() certificate verification keeps working.
+        """
+        import smtplib
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port,
+                              timeout=self.SMTP_CONNECT_TIMEOUT)
+        server.starttls()
+        server.login(self.smtp_username, self.smtp_password)
+        return server
+
+    def _smtp_send(self, recipients: List[str], payload: bytes):
+        """
+        Send a pre-serialized message over an SMTP session kept open across polls
+
+        The payload is the msg.as_bytes() output, serialized exactly
+        once by the caller; smtplib would otherwise re-encode the whole
+        MIME tree per send attempt.
+
+        The TLS handshake plus login costs hundreds of milliseconds per
+        send; reuse the session, health-check it with NOOP before each
+        send, and reconnect when the server has dropped it or the
+        per-connection message cap is reached. Serialized with a lock so
+        a send abandoned by the dispatch timeout cannot interleave SMTP
+        commands with the next cycle's send on the shared socket.
+        """
+        with self._smtp_lock:
+            if self._smtp is not None and self._smtp_msg_count >= self.SMTP_MAX_MSGS_PER_CONN:
+                self.logger.debug("SMTP session hit %s messages - cycling connection",
+                                  self._smtp_msg_count)
+                self._close_smtp()
+            if self._smtp is not None:
+                try:
+                    code, _ = self._smtp.noop()
+                    if code != 250:
+                        raise RuntimeError(f"NOOP returned {code}")
+                except Exception as e:
+                    self.logger.debug("Cached SMTP session unusable (%s) - reconnecting", e)
+                    self._close_smtp()
+            if self._smtp is None:
+                self._smtp = self._smtp_connect()
+                self._smtp_msg_count = 0
+            # One DATA transaction covers every recipient; sendmail reports
+            # partially refused addresses in its return value rather than
+            # raising, so surface those instead of silently dropping them
+            refused = self._smtp.sendmail(self.smtp_from_address, recipients, payload)
+            self._smtp_msg_count += 1
+        for addr, (code, resp) in refused.items():
+            self.logger.warning(f"⚠️  Recipient refused by SMTP server: {addr} ({code} {resp})")
+
+    def _close_smtp(self):
+        """Quit the cached SMTP session, tolerating dead connections"""
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception as e:
+                    self.logger.debug("Error closing SMTP session: %s", e)
+                self._smtp = None
+
+    def _close_notifications(self):
+        """Close the persistent SMTP session and the channel fan-out pool"""
+        if self._notify_pool is not None:
+            self._notify_pool.shutdown(wait=True)
+            self._notify_pool = None
+        self._close_smtp()
+        self._twilio_client = None
+
+    def _build_alert_text(self, new_charges: List[Charge], new_dockets: List[DocketEntry]) -> str:
+        """Build the plain-text summary of one defendant's new entries"""
         message_parts = []
-        message_parts.append(f"🚨 Court Alert: {self.defendant_first_name} {self.defendant_last_name}")
 
         if new_charges:
             message_parts.append(f"\n⚖️  {len(new_charges)} NEW CHARGE(S):")
@@ -2349,105 +3227,47 @@ class MiamiDadeCourtMonitor:
             if len(new_dockets) > 3:
                 message_parts.append(f"  • ...and {len(new_dockets) - 3} more")
 
-        message = "\n".join(message_parts)
-
-        # Send SMS via Twilio
-        if self.notification_sms:
-            try:
-                from twilio.rest import Client
-
-                if not all([self.twilio_account_sid, self.twilio_auth_token, self.twilio_phone_number]):
-                    self.logger.warning("⚠️  Twilio credentials not found in configuration")
-                    self.logger.warning("   Set twilio_account_sid, twilio_auth_token, and twilio_phone_number in config file")
-                else:
-                    client = Client(self.twilio_account_sid, self.twilio_auth_token)
-
-                    sms_message = client.messages.create(
-                        body=message,
-                        from_=self.twilio_phone_number,
-                        to=self.notification_sms
-                    )
-
-                    self.logger.info(f"📱 SMS sent to {self.notification_sms} (SID: {sms_message.sid})")
-
-            except ImportError:
-                self.logger.error("❌ Twilio library not installed. Run: pip install twilio")
-            except Exception as e:
-                self.logger.error(f"❌ Error sending SMS: {e}")
-
-        # Send Email
-        if self.notification_email:
-            try:
-                import smtplib
-                from email.mime.text import MIMEText
-                from email.mime.multipart import MIMEMultipart
-
-                if not all([self.smtp_server, self.smtp_username, self.smtp_password]):
-                    self.logger.warning("⚠️  Email credentials not found in configuration")
-                    self.logger.warning("   Set smtp_server, smtp_username, and smtp_password in config file")
-                else:
-                    # Create email message
-                    msg = MIMEMultipart('alternative')
-                    msg['Subject'] = f"🚨 Court Alert: {self.defendant_first_name} {self.defendant_last_name}"
-                    msg['From'] = self.smtp_from_address
-                    msg['To'] = self.notification_email
-
-                    # Create plain text version
-                    text_body = message
+        return "\n".join(message_parts)
 
-                    # Create HTML version
-                    html_body = f"""
-                    <html>
-                      <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                        <div style="background-color: #f44336; color: white; padding: 15px; border-radius: 5px 5px 0 0;">
-                          <h2 style="margin: 0;">🚨 Court Alert</h2>
-                          <p style="margin: 5px 0 0 0; font-size: 16px;">{self.defendant_first_name} {self.defendant_last_name}</p>
-                        </div>
-                        <div style="padding: 20px; background-color: #f5f5f5; border-radius: 0 0 5px 5px;">
-                    """
+    def _build_alert_html_sections(self, new_charges: List[Charge], new_dockets: List[DocketEntry],
+                                   charges_by_case: Dict[str, List[Charge]],
+                                   dockets_by_case: Dict[str, List[DocketEntry]]) -> str:
+        """Build the charges/dockets HTML blocks of one defendant's alert"""
+        parts = []
 
-                    if new_charges:
-                        html_body += f"""
+        if new_charges:
+            parts.append(f"""
                           <div style="background-color: white; padding: 15px; margin-bottom: 15px; border-radius: 5px; border-left: 4px solid #ff9800;">
                             <h3 style="margin: 0 0 10px 0; color: #ff9800;">⚖️  {len(new_charges)} NEW CHARGE(S)</h3>
-                        """
-                        # Group charges by case
-                        charges_by_case = {}
-                        for charge in new_charges:
-                            if charge.case_number not in charges_by_case:
-                                charges_by_case[charge.case_number] = []
-                            charges_by_case[charge.case_number].append(charge)
-
-                        for case_number, charges in charges_by_case.items():
-                            html_body += f"""
+                        """)
+            for case_number, charges in charges_by_case.items():
+                items = "".join(
+                    self.EMAIL_CHARGE_ITEM.format(desc=charge.charge_description,
+                                                  type=charge.charge_type)
+                    for charge in charges)
+                parts.append(f"""
                             <div style="margin-bottom: 15px;">
                               <h4 style="margin: 10px 0 5px 0; color: #666; font-size: 14px;">📋 Case: {case_number}</h4>
                               <ul style="margin: 5px 0; padding-left: 20px;">
-                            """
-                            for charge in charges:
-                                html_body += f"<li><strong>{charge.charge_description}</strong> ({charge.charge_type})</li>"
-                            html_body += """
+                              {items}
                               </ul>
                             </div>
-                            """
-                        html_body += """
+                            """)
+            parts.append("""
                           </div>
-                        """
+                        """)
 
-                    if new_dockets:
-                        html_body += f"""
+        if new_dockets:
+            parts.append(f"""
                           <div style="background-color: white; padding: 15px; border-radius: 5px; border-left: 4px solid #2196f3;">
                             <h3 style="margin: 0 0 10px 0; color: #2196f3;">📄 {len(new_dockets)} NEW DOCKET ENTRY/ENTRIES</h3>
-                        """
-                        # Group dockets by case
-                        dockets_by_case = {}
-                        for docket in new_dockets:
-                            if docket.case_number not in dockets_by_case:
-                                dockets_by_case[docket.case_number] = []
-                            dockets_by_case[docket.case_number].append(docket)
-
-                        for case_number, dockets in dockets_by_case.items():
-                            html_body += f"""
+                        """)
+            for case_number, dockets in dockets_by_case.items():
+                rows = "".join(
+                    self.EMAIL_DOCKET_ROW.format(din=docket.din, date=docket.date,
+                                                 desc=docket.docket_description)
+                    for docket in dockets)
+                parts.append(f"""
                             <div style="margin-bottom: 15px;">
                               <h4 style="margin: 10px 0 5px 0; color: #666; font-size: 14px;">📋 Case: {case_number}</h4>
                               <table style="width: 100%; border-collapse: collapse;">
@@ -2459,58 +3279,149 @@ class MiamiDadeCourtMonitor:
                                   </tr>
                                 </thead>
                                 <tbody>
-                            """
-                            for docket in dockets:
-                                html_body += f"""
-                                  <tr style="border-bottom: 1px solid #eee;">
-                                    <td style="padding: 8px;">{docket.din}</td>
-                                    <td style="padding: 8px;">{docket.date}</td>
-                                    <td style="padding: 8px;">{docket.docket_description}</td>
-                                  </tr>
-                                """
-                            html_body += """
+                                {rows}
                                 </tbody>
                               </table>
                             </div>
-                            """
-                        html_body += """
+                            """)
+            parts.append("""
                           </div>
-                        """
+                        """)
 
-                    html_body += """
-                        </div>
-                        <div style="text-align: center; padding: 15px; color: #999; font-size: 12px;">
-                          <p>Miami-Dade Court Docket Monitor</p>
-                        </div>
-                      </body>
-                    </html>
-                    """
+        return "".join(parts)
+
+    def _send_sms_alert(self, message: str):
+        """Send one SMS through the cached Twilio client"""
+        try:
+            if not all([self.twilio_account_sid, self.twilio_auth_token, self.twilio_phone_number]):
+                self.logger.warning("⚠️  Twilio credentials not found in configuration")
+                self.logger.warning("   Set twilio_account_sid, twilio_auth_token, and twilio_phone_number in config file")
+                return
+            client = self._get_twilio_client()
+            sms_message = client.messages.create(
+                body=message,
+                from_=self.twilio_phone_number,
+                to=self.notification_sms
+            )
+            self.logger.info("📱 SMS sent to %s (SID: %s)", self.notification_sms, sms_message.sid)
+        except ImportError:
+            self.logger.error("❌ Twilio library not installed. Run: pip install twilio")
+        except Exception as e:
+            self.logger.error("❌ Error sending SMS: %s", e)
 
-                    # Attach both versions
-                    part1 = MIMEText(text_body, 'plain')
-                    part2 = MIMEText(html_body, 'html')
-                    msg.attach(part1)
-                    msg.attach(part2)
+    def _send_email_alert(self, subject: str, text_body: str, html_body: str):
+        """Send one alert email over the persistent SMTP session"""
+        try:
+            if not all([self.smtp_server, self.smtp_username, self.smtp_password]):
+                self.logger.warning("⚠️  Email credentials not found in configuration")
+                self.logger.warning("   Set smtp_server, smtp_username, and smtp_password in config file")
+                return
+            msg = MIMEMultipart('alternative')
+            msg['Subject'] = subject
+            msg['From'] = self.smtp_from_address
+            msg['To'] = self.notification_email
+            msg.attach(MIMEText(text_body, 'plain'))
+            if html_body:
+                msg.attach(MIMEText(html_body, 'html'))
+
+            # Serialize the MIME tree exactly once, straight to bytes -
+            # as_string() would add an extra decode/encode round trip
+            self._smtp_send(self._email_recipients, msg.as_bytes())
+            self.logger.info("📧 Email sent to %s", ', '.join(self._email_recipients))
+        except Exception as e:
+            self.logger.error("❌ Error sending email: %s", e)
 
-                    # Send email (supports comma-separated multiple recipients)
-                    recipients = [email.strip() for email in self.notification_email.split(',')]
-                    with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                        server.starttls()
-                        server.login(self.smtp_username, self.smtp_password)
-                        server.sendmail(self.smtp_from_address, recipients, msg.as_string())
+    def _dispatch_notifications(self, subject: str, message: str, html_body: str):
+        """
+        Fan one alert out to every configured channel
 
-                    self.logger.info(f"📧 Email sent to {', '.join(recipients)}")
+        SMS (Twilio HTTPS) and email (SMTP) are independent network calls,
+        so with both configured they run concurrently in a small pool
+        instead of back to back; each channel logs its own failures.
+        """
+        jobs = []
+        if self.notification_sms:
+            jobs.append((self._send_sms_alert, (message,)))
+        if self.notification_email:
+            jobs.append((self._send_email_alert, (subject, message, html_body)))
 
-            except ImportError:
-                self.logger.error("❌ Email libraries not available (should be built-in)")
-            except Exception as e:
-                self.logger.error(f"❌ Error sending email: {e}")
+        if not jobs:
+            return
+        if len(jobs) == 1:
+            fn, args = jobs[0]
+            fn(*args)
+            return
+
+        if self._notify_pool is None:
+            self._notify_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='notify')
+        futures = [self._notify_pool.submit(fn, *args) for fn, args in jobs]
+        # The channels swallow their own exceptions; the only thing that
+        # can surface here is the wait timing out on a stalled send, and
+        # a slow notification must never take down the poll loop
+        try:
+            for future in as_completed(futures, timeout=60):
+                future.result()
+        except FuturesTimeoutError:
+            self.logger.error("❌ Notification channel still running after 60s - not waiting")
+
+    def _send_notification(self, new_charges: List[Charge], new_dockets: List[DocketEntry],
+                           charges_by_case: Dict[str, List[Charge]],
+                           dockets_by_case: Dict[str, List[DocketEntry]]):
+        """
+        Send notifications about new charges and dockets via SMS and/or email
+
+        The by-case groupings are computed once per cycle in
+        _record_case_results and passed down rather than rebuilt here.
+
+        Configuration in JSON file for Twilio SMS:
+        - twilio_account_sid: Your Twilio Account SID
+        - twilio_auth_token: Your Twilio Auth Token
+        - twilio_phone_number: Your Twilio phone number (e.g., +12345678900)
+
+        Configuration in JSON file for Email:
+        - smtp_server: SMTP server (e.g., smtp.gmail.com)
+        - smtp_port: SMTP port (default: 587)
+        - smtp_username: Your email username
+        - smtp_password: Your email password or app password
+        - smtp_from_address: From address (optional, defaults to smtp_username)
+        """
+        # Nothing new means nothing to build or send - skip all I/O
+        if not new_charges and not new_dockets:
+            return
+
+        # Build notification message
+        subject = f"🚨 Court Alert: {self.display_name}"
+        message = "\n".join([
+            subject,
+            self._build_alert_text(new_charges, new_dockets),
+        ])
+
+        # HTML version - collect fragments and join once rather than
+        # growing one string per append; skipped outright for
+        # SMS-gateway-only recipient lists
+        html_body = "".join([
+            self.EMAIL_HTML_HEADER.format(
+                banner_color='#f44336', title='🚨 Court Alert',
+                defendant=f"{self.display_name}"),
+            self._build_alert_html_sections(new_charges, new_dockets,
+                                            charges_by_case, dockets_by_case),
+            self.EMAIL_HTML_FOOTER.format(footer='Miami-Dade Court Docket Monitor'),
+        ]) if self._email_wants_html else ''
 
         if not self.notification_sms and not self.notification_email:
-            self.logger.info(f"📧 Notification: {len(new_charges)} new charges, {len(new_dockets)} new dockets (no recipients configured)")
+            self.logger.info("📧 Notification: %d new charges, %d new dockets (no recipients configured)", len(new_charges), len(new_dockets))
+            return
+
+        self._dispatch_notifications(subject, message, html_body)
 
-    def on_new_entries(self, results: Dict):
-        """Handle new charges, docket entries, and ICE status changes"""
+    def on_new_entries(self, results: Dict, defer_notifications: bool = False):
+        """
+        Handle new charges, docket entries, and ICE status changes
+
+        With defer_notifications=True the court SMS/email send is skipped
+        so the caller can batch alerts from several monitors into one
+        notification per cycle (see send_combined_notification).
+        """
         new_charges = results['new_charges']
         new_dockets = results['new_dockets']
         ice_changes = results.get('ice_changes', [])
@@ -2525,14 +3436,7 @@ class MiamiDadeCourtMonitor:
             print(f"⚖️  FOUND {len(new_charges)} NEW CHARGE(S)!")
             print("="*80)
 
-            # Group by case
-            by_case = {}
-            for charge in new_charges:
-                if charge.case_number not in by_case:
-                    by_case[charge.case_number] = []
-                by_case[charge.case_number].append(charge)
-
-            for case_number, charges in by_case.items():
+            for case_number, charges in results['new_charges_by_case'].items():
                 print(f"\n📋 Case: {case_number} ({len(charges)} new charge(s))")
                 print("-" * 80)
                 for charge in charges:
@@ -2540,7 +3444,7 @@ class MiamiDadeCourtMonitor:
                     print(f"  Charge: {charge.charge_description}")
                     print(f"  Type: {charge.charge_type}")
                     print(f"  Disposition: {charge.disposition}")
-                    print(f"  Found at: {charge.timestamp_found}")
+                    print(f"  Found at: {datetime.fromtimestamp(charge.timestamp_found)}")
                     print()
 
             print("="*80)
@@ -2551,14 +3455,7 @@ class MiamiDadeCourtMonitor:
             print(f"📄 FOUND {len(new_dockets)} NEW DOCKET ENTRY/ENTRIES!")
             print("="*80)
 
-            # Group by case
-            by_case = {}
-            for docket in new_dockets:
-                if docket.case_number not in by_case:
-                    by_case[docket.case_number] = []
-                by_case[docket.case_number].append(docket)
-
-            for case_number, dockets in by_case.items():
+            for case_number, dockets in results['new_dockets_by_case'].items():
                 print(f"\n📋 Case: {case_number} ({len(dockets)} new docket entry/entries)")
                 print("-" * 80)
                 for docket in dockets:
@@ -2566,7 +3463,7 @@ class MiamiDadeCourtMonitor:
                     print(f"  Date: {docket.date}")
                     print(f"  Docket: {docket.docket_description}")
                     print(f"  Book/Page: {docket.book_page}")
-                    print(f"  Found at: {docket.timestamp_found}")
+                    print(f"  Found at: {datetime.fromtimestamp(docket.timestamp_found)}")
                     print()
 
             print("="*80)
@@ -2574,7 +3471,10 @@ class MiamiDadeCourtMonitor:
         # Save to file and send court notifications only if there are court changes
         if new_charges or new_dockets:
             self._save_new_entries_to_file(new_charges, new_dockets)
-            self._send_notification(new_charges, new_dockets)
+            if not defer_notifications:
+                self._send_notification(new_charges, new_dockets,
+                                        results['new_charges_by_case'],
+                                        results['new_dockets_by_case'])
 
         # Handle ICE changes
         ice_changes = results.get('ice_changes', [])
@@ -2597,8 +3497,8 @@ class MiamiDadeCourtMonitor:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         data = {
             'timestamp': timestamp,
-            'new_charges': [asdict(c) for c in charges],
-            'new_dockets': [asdict(d) for d in dockets]
+            'new_charges': [_record_dict(c) for c in charges],
+            'new_dockets': [_record_dict(d) for d in dockets]
         }
 
         filename = f"new_entries_{timestamp}.json"
@@ -2677,7 +3577,7 @@ class MiamiDadeCourtMonitor:
         self.logger.info("🚀 Starting Miami-Dade Docket Monitor")
         self.logger.info("="*60)
         self.logger.info(f"⏱️  Poll interval: {self.poll_interval} seconds ({self.poll_interval // 60} minutes)")
-        self.logger.info(f"👤 Monitoring defendant: {self.defendant_first_name} {self.defendant_last_name} ({self.defendant_sex})")
+        self.logger.info(f"👤 Monitoring defendant: {self.display_name} ({self.defendant_sex})")
         if self.ice_monitoring:
             self.logger.info(f"🔒 ICE detainee monitoring: ENABLED (Country: {self.country_of_birth})")
 
@@ -2692,6 +3592,12 @@ class MiamiDadeCourtMonitor:
                 print(f"Check #{iteration} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
                 print("="*80)
 
+                # Recycle the context (not the browser) between cycles so
+                # each check starts from a clean cookie/cache state without
+                # paying a multi-second Chromium relaunch
+                if iteration > 1:
+                    self._new_context()
+
                 results = self.check_all_cases()
 
                 self.on_new_entries(results)
@@ -2711,8 +3617,61 @@ class MiamiDadeCourtMonitor:
             self.logger.error(f"❌ Monitor error: {e}")
             raise
         finally:
-            # Clean up browser
+            # Snapshot on the way out so the journal can be compacted
+            self._save_state(force=True)
+            # Clean up browser and notification connections
             self._close_browser()
+            self._close_notifications()
+
+
+def send_combined_notification(alerts: List[tuple]):
+    """
+    Send one SMS and one email covering every defendant with new entries
+
+    Args:
+        alerts: List of (monitor, results) pairs collected across one
+            polling cycle; the first monitor with notification recipients
+            configured provides the channels and credentials
+
+    One Twilio call and one SMTP send per cycle instead of one per
+    defendant - fewer handshakes and fewer billed messages.
+    """
+    if not alerts:
+        return
+    sender = next((m for m, _ in alerts
+                   if m.notification_sms or m.notification_email), None)
+    if sender is None:
+        return
+
+    total_charges = sum(len(r['new_charges']) for _, r in alerts)
+    total_dockets = sum(len(r['new_dockets']) for _, r in alerts)
+
+    want_html = sender._email_wants_html
+    text_sections = [f"🚨 Court Alert: {len(alerts)} defendant(s), "
+                     f"{total_charges} new charge(s), {total_dockets} new docket(s)"]
+    html_sections = [sender.EMAIL_HTML_HEADER.format(
+        banner_color='#f44336', title='🚨 Court Alert',
+        defendant=f"{len(alerts)} defendant(s)")] if want_html else []
+
+    for monitor, results in alerts:
+        name = monitor.display_name
+        text_sections.append(f"\n{name}:" + monitor._build_alert_text(
+            results['new_charges'], results['new_dockets']))
+        if want_html:
+            html_sections.append(
+                f'<h3 style="margin: 15px 0 5px 0; color: #333;">{name}</h3>')
+            html_sections.append(monitor._build_alert_html_sections(
+                results['new_charges'], results['new_dockets'],
+                results['new_charges_by_case'], results['new_dockets_by_case']))
+
+    if want_html:
+        html_sections.append(sender.EMAIL_HTML_FOOTER.format(
+            footer='Miami-Dade Court Docket Monitor'))
+    message = "\n".join(text_sections)
+
+    sender._dispatch_notifications(
+        f"🚨 Court Alert: {len(alerts)} defendant(s)",
+        message, "".join(html_sections))
 
 
 def load_monitor_config(config_file, args):
@@ -2728,6 +3687,8 @@ def load_monitor_config(config_file, args):
     documents_dir = args.documents_dir if hasattr(args, 'documents_dir') else "court_documents"
     filter_case_number = args.case if hasattr(args, 'case') else ""
     enable_screenshots = args.screenshots if hasattr(args, 'screenshots') else False
+    parallel_cases = args.parallel_cases if hasattr(args, 'parallel_cases') else 1
+    download_concurrency = args.download_concurrency if hasattr(args, 'download_concurrency') else 4
 
     # SMTP configuration
     smtp_server = ""
@@ -2760,6 +3721,8 @@ def load_monitor_config(config_file, args):
             notification_email = config.get('notification_email', notification_email)
             download_documents = config.get('download_documents', download_documents)
             documents_dir = config.get('documents_dir', documents_dir)
+            parallel_cases = config.get('parallel_cases', parallel_cases)
+            download_concurrency = config.get('download_concurrency', download_concurrency)
 
             # SMTP configuration
             smtp_server = config.get('smtp_server', smtp_server)
@@ -2799,9 +3762,7 @@ def load_monitor_config(config_file, args):
 
     # Auto-generate data file name based on defendant if using default
     if data_file == 'docket_monitor_data.json':
-        safe_first = defendant_first_name.lower().replace(' ', '_')
-        safe_last = defendant_last_name.lower().replace(' ', '_')
-        data_file = f"docket_monitor_{safe_last}_{safe_first}.json"
+        data_file = _default_data_file(defendant_first_name, defendant_last_name)
 
     return {
         'defendant_first_name': defendant_first_name,
@@ -2816,6 +3777,8 @@ def load_monitor_config(config_file, args):
         'documents_dir': documents_dir,
         'filter_case_number': filter_case_number,
         'enable_screenshots': enable_screenshots,
+        'parallel_cases': parallel_cases,
+        'download_concurrency': download_concurrency,
         'smtp_server': smtp_server,
         'smtp_port': smtp_port,
         'smtp_username': smtp_username,
@@ -2832,7 +3795,47 @@ def load_monitor_config(config_file, args):
     }
 
 
-def main():
+_PRINT_LOCK = threading.Lock()
+
+
+def _run_single_check(config: Dict, defer_notifications: bool):
+    """
+    Run one defendant's check with its own monitor and browser
+
+    Used by the --once worker pool: each worker owns an isolated
+    monitor (own data_file, own Playwright instance), so the only
+    shared state is stdout - the summary block is printed under a
+    module lock to keep interleaved defendants readable.
+
+    Returns:
+        (monitor, results) so the caller can batch alerts into one
+        combined notification per cycle
+    """
+    monitor = MiamiDadeCourtMonitor(**config)
+    try:
+        monitor._init_browser()
+        results = monitor.check_all_cases()
+        monitor.on_new_entries(results, defer_notifications=defer_notifications)
+        monitor._save_state(force=True)
+        with _PRINT_LOCK:
+            print("=" * 80)
+            print(f"Defendant: {config['defendant_first_name']} {config['defendant_last_name']}")
+            print("=" * 80)
+            monitor.print_summary(results)
+            print()
+        return monitor, results
+    finally:
+        monitor._close_browser()
+
+
+_PARSER = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build (once) and cache the command-line parser"""
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
     parser = argparse.ArgumentParser(
         description='Monitor Miami-Dade court dockets for new entries',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2933,12 +3936,35 @@ Config file format (config.json):
         action='store_true',
         help='Enable debug screenshots (default: off)'
     )
+    parser.add_argument(
+        '--parallel-cases',
+        type=int,
+        default=1,
+        help='Number of cases to scrape concurrently, each in its own browser (default: 1)'
+    )
+    parser.add_argument(
+        '--download-concurrency',
+        type=int,
+        default=4,
+        help='Max simultaneous direct document downloads per case (default: 4)'
+    )
     parser.add_argument(
         '--test-ice',
         action='store_true',
         help='Only run ICE detainee locator check (skip court monitor)'
     )
+    parser.add_argument(
+        '--export-json',
+        action='store_true',
+        help='Export the tracked state as human-readable JSON and exit'
+    )
+
+    _PARSER = parser
+    return parser
 
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Set download_documents based on --no-downloads flag
@@ -2975,9 +4001,7 @@ Config file format (config.json):
 
         # Auto-generate data file name based on defendant if using default
         if data_file == 'docket_monitor_data.json':
-            safe_first = defendant_first_name.lower().replace(' ', '_')
-            safe_last = defendant_last_name.lower().replace(' ', '_')
-            data_file = f"docket_monitor_{safe_last}_{safe_first}.json"
+            data_file = _default_data_file(defendant_first_name, defendant_last_name)
 
         monitor_configs.append({
             'defendant_first_name': defendant_first_name,
@@ -2992,6 +4016,8 @@ Config file format (config.json):
             'documents_dir': args.documents_dir,
             'filter_case_number': args.case,
             'enable_screenshots': args.screenshots,
+            'parallel_cases': args.parallel_cases,
+            'download_concurrency': args.download_concurrency,
             'smtp_server': '',
             'smtp_port': 587,
             'smtp_username': '',
@@ -3012,6 +4038,14 @@ Config file format (config.json):
         if config['poll_interval'] < 60:
             print(f"⚠️  Warning: Interval < 60 seconds may be too aggressive for {config['defendant_first_name']} {config['defendant_last_name']}")
 
+    # --export-json: dump tracked state for human inspection and exit
+    if args.export_json:
+        for config in monitor_configs:
+            monitor = MiamiDadeCourtMonitor(**config)
+            out_file = monitor.export_state_json()
+            print(f"💾 Exported state to {out_file}")
+        return 0
+
     # --test-ice: Only run ICE detainee locator check, skip court monitor
     if args.test_ice:
         for idx, config in enumerate(monitor_configs, 1):
@@ -3042,37 +4076,87 @@ Config file format (config.json):
 
     # Run monitors
     if args.once:
-        # Run once mode - check each defendant sequentially
+        # Run once mode - check defendants concurrently, each with its
+        # own browser. Capped at 4 workers so a long defendant list does
+        # not hammer the court site (see the aggressive-polling warning).
         print(f"\n🔍 Running single check for {len(monitor_configs)} defendant(s)...\n")
 
-        for idx, config in enumerate(monitor_configs, 1):
-            print("=" * 80)
-            print(f"Defendant {idx}/{len(monitor_configs)}: {config['defendant_first_name']} {config['defendant_last_name']}")
-            print("=" * 80)
-
-            monitor = MiamiDadeCourtMonitor(**config)
-            try:
-                monitor._init_browser()
-                results = monitor.check_all_cases()
-                monitor.on_new_entries(results)
-                monitor.print_summary(results)
-            finally:
-                monitor._close_browser()
+        # With several defendants, collect alerts and send one combined
+        # notification at the end of the cycle instead of one per defendant
+        batch_alerts = len(monitor_configs) > 1
+        pending_alerts = []
+
+        if batch_alerts:
+            with ThreadPoolExecutor(max_workers=min(len(monitor_configs), 4),
+                                    thread_name_prefix='defendant') as pool:
+                futures = {pool.submit(_run_single_check, config, True): config
+                           for config in monitor_configs}
+                for future in as_completed(futures):
+                    config = futures[future]
+                    try:
+                        alert_monitor, results = future.result()
+                    except Exception as e:
+                        print(f"❌ {config['defendant_first_name']} {config['defendant_last_name']}: {e}")
+                        continue
+                    if results['new_charges'] or results['new_dockets']:
+                        pending_alerts.append((alert_monitor, results))
+        else:
+            _run_single_check(monitor_configs[0], False)
 
-            if idx < len(monitor_configs):
-                print("\n")
+        if pending_alerts:
+            send_combined_notification(pending_alerts)
+            for alert_monitor, _ in pending_alerts:
+                alert_monitor._close_notifications()
 
         print("\n✅ All checks complete.")
     else:
         # Continuous monitoring mode
         if len(monitor_configs) > 1:
-            print("⚠️  Warning: Continuous monitoring of multiple defendants not yet supported.")
-            print("Please use --once flag or run separate instances for each defendant.")
-            return 1
+            # Poll all defendants round-robin from one loop, sharing a
+            # single browser (one context per monitor per cycle) instead
+            # of running a browser per defendant
+            monitors = [MiamiDadeCourtMonitor(**config) for config in monitor_configs]
+            poll_interval = min(m.poll_interval for m in monitors)
+            primary = monitors[0]
+            print(f"\n🔍 Monitoring {len(monitors)} defendants every {poll_interval} seconds...\n")
 
-        # Run single monitor in continuous mode
-        monitor = MiamiDadeCourtMonitor(**monitor_configs[0])
-        monitor.run()
+            try:
+                primary._init_browser()
+                for m in monitors[1:]:
+                    m.playwright = primary.playwright
+                    m.browser = primary.browser
+
+                iteration = 0
+                while True:
+                    iteration += 1
+                    pending_alerts = []
+                    for m in monitors:
+                        m._new_context()
+                        results = m.check_all_cases()
+                        m.on_new_entries(results, defer_notifications=True)
+                        if results['new_charges'] or results['new_dockets']:
+                            pending_alerts.append((m, results))
+                    if pending_alerts:
+                        send_combined_notification(pending_alerts)
+                    time.sleep(poll_interval)
+            except KeyboardInterrupt:
+                print("\n\n🛑 Monitor stopped by user")
+            finally:
+                for m in monitors:
+                    m._save_state(force=True)
+                    m._close_notifications()
+                # The browser belongs to the primary monitor; drop the
+                # shared references before tearing it down
+                for m in monitors[1:]:
+                    m.context = None
+                    m.page = None
+                    m.browser = None
+                    m.playwright = None
+                primary._close_browser()
+        else:
+            # Run single monitor in continuous mode
+            monitor = MiamiDadeCourtMonitor(**monitor_configs[0])
+            monitor.run()
 
     return 0
 